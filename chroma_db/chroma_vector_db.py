@@ -87,6 +87,30 @@ class ChromaVectorDB:
 
         return Status.FAILURE if any_failure else Status.SUCCESS
 
+    def store_embeddings_columnar(
+        self, hashes: List[str], embeddings: List[List[float]]
+    ) -> int:
+        """
+        Store embeddings given as parallel columns in a single upsert.
+        Args:
+            hashes (List[str]): Paper hashes used as ids
+            embeddings (List[List[float]]): Embedding vectors aligned with hashes
+        Returns:
+            int: Status.SUCCESS if the upsert succeeded, Status.FAILURE otherwise
+        Side effects:
+            Upserts embeddings into the ChromaDB collection.
+        """
+        if not hashes:
+            return Status.SUCCESS
+
+        try:
+            self.collection.upsert(ids=hashes, embeddings=embeddings)
+        except Exception as e:
+            logger.error(f"Failed to store {len(hashes)} embeddings: {e}")
+            return Status.FAILURE
+
+        return Status.SUCCESS
+
     def perform_similarity_search(
         self,
         k: int,
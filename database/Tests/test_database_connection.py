@@ -0,0 +1,42 @@
+from unittest.mock import MagicMock
+
+from psycopg2 import extensions
+
+from database import database_connection as dbc
+
+
+class _FakeSession:
+    """
+    Stand-in for a pooled session that needs no server: only the attributes
+    _PooledConnection.close() and _checkout_connection() touch.
+    """
+
+    closed = 0
+    autocommit = False
+    _in_pool = False
+    close = dbc._PooledConnection.close
+
+    def get_transaction_status(self):
+        return extensions.TRANSACTION_STATUS_IDLE
+
+
+def test_double_close_returns_session_to_pool_once(monkeypatch):
+    """
+    Closing the same session twice must not put it into the pool twice, so two
+    checkouts never hand out one shared session.
+    """
+    monkeypatch.setattr(dbc, "_idle_connections", [])
+    monkeypatch.setattr(dbc, "_is_alive", lambda conn: True)
+    fresh = object()
+    monkeypatch.setattr(dbc.psycopg2, "connect", MagicMock(return_value=fresh))
+
+    session = _FakeSession()
+    session.close()
+    session.close()
+
+    assert dbc._idle_connections == [session]
+    first = dbc._checkout_connection()
+    second = dbc._checkout_connection()
+    assert first is session
+    assert second is fresh
+    assert first is not second
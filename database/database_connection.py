@@ -1,28 +1,150 @@
+import atexit
+from contextlib import contextmanager
+from functools import lru_cache
+from dotenv import load_dotenv
 import psycopg2
+from psycopg2 import extensions
 import os
+import threading
 
+load_dotenv()
 
-def connect_to_db():  # outside_chroma=False)
+# Upper bound on idle sessions kept open for reuse; extra ones are really closed.
+_POOL_MAX_IDLE = int(os.getenv("DB_POOL_MAX_IDLE", "8"))
+_idle_connections = []
+_idle_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _conn_kwargs():
+    """
+    Connection parameters, read from the environment once, on the first connect
+    (not at import, so settings applied after import, e.g. by test fixtures, count).
+    """
+    return {
+        "host": os.getenv("DB_HOST", "127.0.0.1"),
+        "dbname": os.getenv("DB_NAME", "papers"),
+        "user": os.getenv("DB_USER", "user"),
+        "password": os.getenv("DB_PASSWORD"),
+        "port": os.getenv("DB_PORT", "5432"),
+        # Pooled sessions may sit idle; keepalives make a dropped peer fail the socket
+        # instead of hanging. This does not set conn.closed, so checkout still probes.
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 10,
+        "keepalives_count": 5,
+        "connect_timeout": 5,
+    }
+
+
+class _PooledConnection(extensions.connection):
+    """
+    psycopg2 connection whose close() hands the session back to the idle pool
+    instead of tearing it down, so callers keep the connect_to_db()/close() idiom.
+    Uncommitted work is rolled back on close(), exactly as a real close would.
+    """
+
+    # True while the session sits in _idle_connections; makes close() idempotent.
+    _in_pool = False
+
+    def close(self):
+        if self.closed or self._in_pool:
+            return
+        try:
+            if self.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                self.rollback()
+            if self.autocommit:
+                self.autocommit = False
+        except psycopg2.Error:
+            super().close()
+            return
+        with _idle_lock:
+            if self._in_pool:  # a concurrent close() already returned it
+                return
+            if len(_idle_connections) < _POOL_MAX_IDLE:
+                self._in_pool = True
+                _idle_connections.append(self)
+                return
+        super().close()
+
+
+def connect_to_db(autocommit=False):  # outside_chroma=False)
     """
     Establishes a connection to the PostgreSQL database.
-    Reads connection parameters from environment variables.
+    Connection parameters come from environment variables (and .env), read once.
+    Reuses an idle pooled session when one is available; closing the returned
+    connection puts it back into the pool.
+    Pass autocommit=True for plain reads: psycopg2 then sends no BEGIN before the
+    first statement and close() has no transaction to roll back.
+    """
+    conn = _checkout_connection()
+    if autocommit:
+        conn.autocommit = True
+    return conn
+
+
+def _checkout_connection():
     """
-    db_host = os.getenv("DB_HOST", "127.0.0.1")
-    db_name = os.getenv("DB_NAME", "papers")
-    db_user = os.getenv("DB_USER", "user")
-    db_password = os.getenv("DB_PASSWORD")
-    db_port = os.getenv("DB_PORT", "5432")
+    Pop a live idle session from the pool, or open a new one if none is left.
+    """
+    while True:
+        with _idle_lock:
+            if not _idle_connections:
+                break
+            conn = _idle_connections.pop()
+            conn._in_pool = False
+        if not conn.closed and _is_alive(conn):
+            return conn
+        # Dropped by the server or the network: discard it for real.
+        extensions.connection.close(conn)
 
     try:
-        return psycopg2.connect(
-            host=db_host,
-            dbname=db_name,
-            user=db_user,
-            password=db_password,
-            port=db_port,
-        )
+        return psycopg2.connect(connection_factory=_PooledConnection, **_conn_kwargs())
         # return conn
     except psycopg2.Error as e:
         print(f"Error connecting to the database: {e}")
         # return None
         raise
+
+
+def _is_alive(conn):
+    """
+    Probe a pooled session with a round-trip; conn.closed stays 0 for a session the
+    server has already dropped (e.g. after a restart or an idle-session timeout).
+    """
+    try:
+        conn.autocommit = True  # no transaction left open by the probe
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.autocommit = False
+    except psycopg2.Error:
+        return False
+    return True
+
+
+@contextmanager
+def db_connection(autocommit=False):
+    """
+    Context manager around connect_to_db() that always hands the connection back
+    to the pool, even when the body raises.
+    Args:
+        autocommit (bool): Passed to connect_to_db(); use for plain reads.
+    Yields:
+        psycopg2 connection: A pooled connection; commit explicitly for writes.
+    """
+    conn = connect_to_db(autocommit)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+@atexit.register
+def close_idle_connections():
+    """
+    Terminate every idle pooled session (registered to run at interpreter exit).
+    """
+    with _idle_lock:
+        idle, _idle_connections[:] = list(_idle_connections), []
+    for conn in idle:
+        extensions.connection.close(conn)
@@ -13,13 +13,137 @@ All database operations are designed to be robust, transactional, and reusable b
 import psycopg2
 from psycopg2 import extras
 from dotenv import load_dotenv
+import csv
 import hashlib
+import io
+import threading
+from collections import OrderedDict
 from utils.status import Status
 import json
+import logging
 from database.database_connection import connect_to_db
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Columns returned by get_paper_by_hash / get_papers_by_hash, in SELECT order.
+_PAPER_COLUMNS = (
+    "paper_hash",
+    "id",
+    "title",
+    "abstract",
+    "authors",
+    "publication_date",
+    "landing_page_url",
+    "pdf_url",
+    "similarity_score",
+    "fwci",
+    "citation_normalized_percentile",
+    "cited_by_count",
+    "counts_by_year",
+    "venue_name",
+    "venue_type",
+    "is_oa",
+    "oa_status",
+    "oa_url",
+)
+
+# Columns where an empty string is stored as NULL; normalised in SQL, not Python.
+_EMPTY_AS_NULL_COLUMNS = frozenset({"publication_date"})
+
+
+def _value_sql(column, value="%s"):
+    """
+    SQL expression for writing a value into a column (NULLIF(value, '') where needed).
+    Args:
+        column (str): Target papers_table column.
+        value (str): Placeholder or source expression for the value.
+    Returns:
+        str: The value expression to use in an INSERT.
+    """
+    return f"NULLIF({value}, '')" if column in _EMPTY_AS_NULL_COLUMNS else value
+
+
+# Joining against the unnested input keeps rows in the caller's (similarity) order.
+_SELECT_PAPERS_BY_HASH_SQL = f"""
+    SELECT {", ".join("p." + column for column in _PAPER_COLUMNS)}
+    FROM unnest(%s::text[]) WITH ORDINALITY AS h(paper_hash, ord)
+    JOIN papers_table p ON p.paper_hash = h.paper_hash
+    ORDER BY h.ord;
+"""
+
+# Columns returned by get_all_papers / iter_all_papers / get_papers_by_original_id.
+_ALL_PAPERS_COLUMNS = _PAPER_COLUMNS[:8]
+_SELECT_ALL_PAPERS_SQL = f"SELECT {', '.join(_ALL_PAPERS_COLUMNS)} FROM papers_table;"
+_SELECT_PAPERS_BY_ORIGINAL_ID_SQL = (
+    f"SELECT {', '.join(_ALL_PAPERS_COLUMNS)} FROM papers_table WHERE id = %s;"
+)
+_SELECT_PAPER_BY_HASH_SQL = (
+    f"SELECT {', '.join(_PAPER_COLUMNS)} FROM papers_table WHERE paper_hash = %s;"
+)
+
+# Papers are keyed by a content hash, so a cached row only goes stale when
+# update_paper / delete_paper_by_hash remove that hash.
+_PAPER_CACHE_SIZE = 4096
+_paper_cache = OrderedDict()
+_paper_cache_lock = threading.Lock()
+# Bumped on every invalidation; a miss only fills the cache if no invalidation ran
+# while it read the row, so a read racing a write cannot re-cache a stale row.
+_paper_cache_generation = 0
+
+# One multi-row INSERT per page instead of a round-trip per paper.
+_INSERT_PAPERS_SQL = f"""
+    INSERT INTO public.papers_table ({", ".join(_PAPER_COLUMNS)})
+    VALUES %s
+    ON CONFLICT (paper_hash) DO NOTHING
+    RETURNING paper_hash;
+"""
+_INSERT_PAPERS_TEMPLATE = f"({', '.join(map(_value_sql, _PAPER_COLUMNS))})"
+_INSERT_PAGE_SIZE = 500
+
+# Batches at least this large are streamed through COPY into a staging table;
+# the staging table keeps ON CONFLICT deduplication, which COPY alone lacks.
+_COPY_THRESHOLD = 1000
+_COPY_NULL = "\\N"
+_CREATE_PAPERS_STAGE_SQL = """
+    CREATE TEMP TABLE papers_stage (LIKE public.papers_table INCLUDING DEFAULTS)
+    ON COMMIT DROP;
+"""
+_COPY_PAPERS_STAGE_SQL = f"""
+    COPY papers_stage ({", ".join(_PAPER_COLUMNS)})
+    FROM STDIN WITH (FORMAT CSV, NULL '{_COPY_NULL}');
+"""
+_INSERT_FROM_PAPERS_STAGE_SQL = f"""
+    INSERT INTO public.papers_table ({", ".join(_PAPER_COLUMNS)})
+    SELECT {", ".join(_value_sql(column, column) for column in _PAPER_COLUMNS)}
+    FROM papers_stage
+    ON CONFLICT (paper_hash) DO NOTHING
+    RETURNING paper_hash;
+"""
+
+# Fields update_paper may change: exactly the fields _generate_paper_hash covers.
+_UPDATABLE_PAPER_FIELDS = (
+    "id",
+    "title",
+    "abstract",
+    "authors",
+    "publication_date",
+    "landing_page_url",
+    "pdf_url",
+)
+_UPDATABLE_PAPER_FIELD_SET = frozenset(_UPDATABLE_PAPER_FIELDS)
+_SELECT_UPDATABLE_FIELDS_SQL = f"""
+    SELECT {", ".join(_UPDATABLE_PAPER_FIELDS)}
+    FROM papers_table
+    WHERE paper_hash = %s;
+"""
+_INSERT_UPDATED_PAPER_SQL = f"""
+    INSERT INTO papers_table (paper_hash, {", ".join(_UPDATABLE_PAPER_FIELDS)})
+    VALUES (%s, {", ".join(map(_value_sql, _UPDATABLE_PAPER_FIELDS))})
+    ON CONFLICT (paper_hash) DO NOTHING;
+"""
+
 
 def _generate_paper_hash(paper_data_dict):
     """
@@ -49,6 +173,69 @@ def _generate_paper_hash(paper_data_dict):
     return hashlib.sha256(data_string.encode("utf-8")).hexdigest()
 
 
+def _paper_row(p, p_hash):
+    """
+    Build the papers_table insert tuple for one paper, in _PAPER_COLUMNS order.
+    Args:
+        p (dict): Paper metadata dict (non-null 'id' and 'title').
+        p_hash (str): The paper's deduplication hash.
+    Returns:
+        tuple: Values ready to be passed to _INSERT_PAPERS_SQL.
+    """
+    # ---------- pull only the numeric percentile ----------
+    cit_norm_raw = p.get("citation_normalized_percentile")
+    cit_norm_pct = (
+        _to_float(cit_norm_raw["value"]) if isinstance(cit_norm_raw, dict) else None
+    )
+
+    counts_years = p.get("counts_by_year")
+    if counts_years is not None:
+        counts_years = json.dumps(counts_years)  # -> JSONB text
+
+    return (
+        p_hash,
+        p["id"],
+        p["title"],
+        p.get("abstract"),
+        p.get("authors"),
+        p.get("publication_date"),
+        p.get("landing_page_url"),
+        p.get("pdf_url"),
+        _to_float(p.get("similarity_score")),
+        _to_float(p.get("fwci")),
+        cit_norm_pct,
+        _to_int(p.get("cited_by_count")),
+        counts_years,
+        p.get("venue_name"),
+        p.get("venue_type"),
+        p.get("is_oa"),
+        p.get("oa_status"),
+        p.get("oa_url"),
+    )
+
+
+def _copy_insert_rows(cur, rows):
+    """
+    Bulk-insert paper rows by streaming them through COPY into a temporary
+    staging table and moving them into papers_table in one statement.
+    Args:
+        cur: Open cursor; the caller owns the transaction.
+        rows (list[tuple]): Rows in _PAPER_COLUMNS order, as built by _paper_row.
+    Returns:
+        list[tuple]: One (paper_hash,) row per newly inserted paper.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        writer.writerow(_COPY_NULL if value is None else value for value in row)
+    buf.seek(0)
+
+    cur.execute(_CREATE_PAPERS_STAGE_SQL)
+    cur.copy_expert(_COPY_PAPERS_STAGE_SQL, buf)
+    cur.execute(_INSERT_FROM_PAPERS_STAGE_SQL)
+    return cur.fetchall()
+
+
 def insert_papers(papers_data_list):
     """
     Insert one or more paper records into the papers_table, including extra metrics.
@@ -63,109 +250,71 @@ def insert_papers(papers_data_list):
     """
     # ---------------- upfront checks -----------------
     if not isinstance(papers_data_list, list):
-        print("insert_papers expects a list of dicts.")
+        logger.error("insert_papers expects a list of dicts.")
         return Status.FAILURE, []
 
     if not papers_data_list:
         return Status.SUCCESS, []
 
-    # ---------------- DB connection ------------------
-    conn = connect_to_db()
-    if conn is None:
-        return Status.FAILURE, []
+    rows = []
+    details_by_hash = {}
 
-    cur = conn.cursor(cursor_factory=extras.DictCursor)
-
-    SQL = """
-        INSERT INTO public.papers_table (
-            paper_hash, id, title, abstract, authors,
-            publication_date, landing_page_url, pdf_url,
-            similarity_score, fwci, citation_normalized_percentile,
-            cited_by_count, counts_by_year,
-            venue_name, venue_type,
-            is_oa, oa_status, oa_url
-        )
-        VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-        ON CONFLICT (paper_hash) DO NOTHING;
-    """
-
-    inserted_details = []
-
-    # ---------------- main loop ----------------------
+    # ---------------- build rows ---------------------
     for p in papers_data_list:
-        if not isinstance(p, dict) or "id" not in p or "title" not in p:
-            print(f"Skipping malformed record: {p!r}")
+        # One NULL in a NOT NULL column would roll back the whole batched insert.
+        if not isinstance(p, dict) or p.get("id") is None or p.get("title") is None:
+            logger.warning("Skipping malformed record: %r", p)
             continue
 
-        try:
-            p_hash = _generate_paper_hash(p)
-
-            abstract = p.get("abstract")
-            authors = p.get("authors")
-            pub_date = p.get("publication_date")
-            landing_url = p.get("landing_page_url")
-            pdf_url = p.get("pdf_url")
-
-            venue_name = p.get("venue_name")
-            venue_type = p.get("venue_type")
-            is_oa = p.get("is_oa")
-            oa_status = p.get("oa_status")
-            oa_url = p.get("oa_url")
-
-            sim_score = _to_float(p.get("similarity_score"))
-            fwci = _to_float(p.get("fwci"))
-
-            # ---------- NEW: pull only the numeric percentile ----------
-            cit_norm_raw = p.get("citation_normalized_percentile")
-            cit_norm_pct = (
-                _to_float(cit_norm_raw["value"])
-                if isinstance(cit_norm_raw, dict)
-                else None
-            )
+        p_hash = _generate_paper_hash(p)
+        if p_hash in details_by_hash:
+            continue  # duplicate within this batch
 
-            cited_count = _to_int(p.get("cited_by_count"))
-
-            counts_years = p.get("counts_by_year")
-            if counts_years is not None:
-                counts_years = json.dumps(counts_years)  # -> JSONB text
-
-            cur.execute(
-                SQL,
-                (
-                    p_hash,
-                    p["id"],
-                    p["title"],
-                    abstract,
-                    authors,
-                    pub_date,
-                    landing_url,
-                    pdf_url,
-                    sim_score,
-                    fwci,
-                    cit_norm_pct,
-                    cited_count,
-                    counts_years,
-                    venue_name,
-                    venue_type,
-                    is_oa,
-                    oa_status,
-                    oa_url,
-                ),
-            )
+        rows.append(_paper_row(p, p_hash))
+        details_by_hash[p_hash] = {
+            "title": p["title"],
+            "abstract": p.get("abstract") or "",
+            "hash": p_hash,
+        }
 
-            if cur.rowcount:
-                inserted_details.append(
-                    {"title": p["title"], "abstract": abstract or "", "hash": p_hash}
-                )
+    if not rows:
+        return Status.FAILURE, []
 
-        except psycopg2.Error as db_err:
-            print(f"[DB] error inserting {p.get('id')}: {db_err.diag.message_primary}")
-            conn.rollback()
+    # ---------------- DB connection ------------------
+    conn = connect_to_db()
+    if conn is None:
+        return Status.FAILURE, []
 
-    # --------------- finalise ------------------------
-    conn.commit()
-    cur.close()
-    conn.close()
+    # ---------------- batched insert -----------------
+    cur = conn.cursor()
+    try:
+        if len(rows) >= _COPY_THRESHOLD:
+            inserted = _copy_insert_rows(cur, rows)
+        else:
+            inserted = extras.execute_values(
+                cur,
+                _INSERT_PAPERS_SQL,
+                rows,
+                template=_INSERT_PAPERS_TEMPLATE,
+                page_size=_INSERT_PAGE_SIZE,
+                fetch=True,
+            )
+        conn.commit()
+    except psycopg2.Error as db_err:
+        logger.error("[DB] error inserting papers: %s", db_err.diag.message_primary)
+        conn.rollback()
+        inserted = []
+    finally:
+        cur.close()
+        conn.close()
+
+    # RETURNING only yields rows that did not hit the ON CONFLICT clause
+    inserted_hashes = {row[0] for row in inserted}
+    inserted_details = [
+        details
+        for p_hash, details in details_by_hash.items()
+        if p_hash in inserted_hashes
+    ]
 
     status_code = Status.SUCCESS if inserted_details else Status.FAILURE
     return status_code, inserted_details
@@ -175,21 +324,60 @@ def get_all_papers():
     """
     Retrieve all papers from the papers_table.
     Returns:
-        list[dict]: List of all paper records as dictionaries.
+        list[dict]: List of all paper records as dictionaries ([] on error).
+    """
+    try:
+        return list(iter_all_papers())
+    except psycopg2.Error:
+        return []  # never hand back a table truncated mid-stream
+
+
+def iter_all_papers(batch_size=2000):
+    """
+    Stream all papers from the papers_table without materialising the whole table.
+    Args:
+        batch_size (int): Number of rows fetched from the server per round-trip.
+    Yields:
+        dict: One paper record at a time.
+    Raises:
+        psycopg2.Error: If the query or the stream fails part-way through.
     """
     conn = connect_to_db()
     if not conn:
-        return []
+        return
 
-    cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-    sql = "SELECT paper_hash, id, title, abstract, authors, publication_date, landing_page_url, pdf_url FROM papers_table;"
+    # A named (server-side) cursor streams rows in batches of itersize.
+    cur = conn.cursor(name="iter_all_papers")
+    cur.itersize = batch_size
     try:
-        cur.execute(sql)
-        papers = [dict(row) for row in cur.fetchall()]
-        return papers
+        cur.execute(_SELECT_ALL_PAPERS_SQL)
+        for row in cur:
+            yield dict(zip(_ALL_PAPERS_COLUMNS, row))
     except psycopg2.Error as e:
-        print(f"Error fetching all papers: {e}")
-        return []
+        logger.error("Error fetching all papers: %s", e)
+        raise
+    finally:
+        cur.close()
+        conn.close()
+
+
+def get_papers_count():
+    """
+    Count the papers stored in the papers_table.
+    Returns:
+        int: Number of paper rows, or 0 if the count could not be fetched.
+    """
+    conn = connect_to_db(autocommit=True)
+    if not conn:
+        return 0
+
+    cur = conn.cursor()
+    try:
+        cur.execute("SELECT COUNT(*) FROM papers_table;")
+        return cur.fetchone()[0]
+    except psycopg2.Error as e:
+        logger.error("Error counting papers: %s", e)
+        return 0
     finally:
         cur.close()
         conn.close()
@@ -203,18 +391,16 @@ def get_papers_by_original_id(original_id):
     Returns:
         list[dict]: List of paper versions as dictionaries.
     """
-    conn = connect_to_db()
+    conn = connect_to_db(autocommit=True)
     if not conn:
         return []
 
-    cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-    sql = "SELECT paper_hash, id, title, abstract, authors, publication_date, landing_page_url, pdf_url FROM papers_table WHERE id = %s;"
+    cur = conn.cursor()
     try:
-        cur.execute(sql, (original_id,))
-        papers = [dict(row) for row in cur.fetchall()]
-        return papers
+        cur.execute(_SELECT_PAPERS_BY_ORIGINAL_ID_SQL, (original_id,))
+        return [dict(zip(_ALL_PAPERS_COLUMNS, row)) for row in cur.fetchall()]
     except psycopg2.Error as e:
-        print(f"Error fetching papers by original ID {original_id}: {e}")
+        logger.error("Error fetching papers by original ID %s: %s", original_id, e)
         return []
     finally:
         cur.close()
@@ -224,45 +410,63 @@ def get_papers_by_original_id(original_id):
 def get_paper_by_hash(paper_hash_to_find):
     """
     Retrieve a specific paper version from the papers_table by its unique hash.
+    Found papers are served from an in-process LRU cache on repeat lookups.
     Args:
         paper_hash_to_find (str): The paper hash to look up.
     Returns:
         dict or None: Paper record as a dictionary, or None if not found.
     """
-    conn = connect_to_db()
+    with _paper_cache_lock:
+        paper = _paper_cache.get(paper_hash_to_find)
+        if paper is not None:
+            _paper_cache.move_to_end(paper_hash_to_find)
+            return dict(paper)
+        generation = _paper_cache_generation
+
+    paper = _get_paper_by_hash_uncached(paper_hash_to_find)
+    # Misses are not cached: the paper may be inserted later under this hash.
+    if paper is not None:
+        with _paper_cache_lock:
+            if generation == _paper_cache_generation:
+                _paper_cache[paper_hash_to_find] = paper
+                if len(_paper_cache) > _PAPER_CACHE_SIZE:
+                    _paper_cache.popitem(last=False)
+        return dict(paper)
+    return None
+
+
+def _invalidate_cached_paper(paper_hash):
+    """
+    Drop a paper from the get_paper_by_hash cache after it was deleted or replaced.
+    Call only after the change is committed.
+    Args:
+        paper_hash (str): The hash whose row changed.
+    """
+    global _paper_cache_generation
+    with _paper_cache_lock:
+        _paper_cache.pop(paper_hash, None)
+        _paper_cache_generation += 1
+
+
+def _get_paper_by_hash_uncached(paper_hash_to_find):
+    """
+    Fetch a paper row by hash straight from the database.
+    Args:
+        paper_hash_to_find (str): The paper hash to look up.
+    Returns:
+        dict or None: Paper record as a dictionary, or None if not found.
+    """
+    conn = connect_to_db(autocommit=True)
     if not conn:
         return None
 
-    cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-    sql = """
-        SELECT
-            paper_hash,
-            id,
-            title,
-            abstract,
-            authors,
-            publication_date,
-            landing_page_url,
-            pdf_url,
-            similarity_score,
-            fwci,
-            citation_normalized_percentile,
-            cited_by_count,
-            counts_by_year,
-            venue_name,
-            venue_type,
-            is_oa,
-            oa_status,
-            oa_url
-        FROM papers_table
-        WHERE paper_hash = %s;
-    """
+    cur = conn.cursor()
     try:
-        cur.execute(sql, (paper_hash_to_find,))
+        cur.execute(_SELECT_PAPER_BY_HASH_SQL, (paper_hash_to_find,))
         paper = cur.fetchone()
-        return dict(paper) if paper else None
+        return dict(zip(_PAPER_COLUMNS, paper)) if paper else None
     except psycopg2.Error as e:
-        print(f"Error fetching paper by hash {paper_hash_to_find}: {e}")
+        logger.error("Error fetching paper by hash %s: %s", paper_hash_to_find, e)
         return None
     finally:
         cur.close()
@@ -278,51 +482,23 @@ def get_papers_by_hash(paper_hashes_to_find):
         list[dict]: List of paper records as dictionaries, in the same order as input hashes.
     """
     if not isinstance(paper_hashes_to_find, list) or not paper_hashes_to_find:
-        print("Error: Input must be a non-empty list of paper hashes.")
+        logger.error("Input must be a non-empty list of paper hashes.")
         return []
 
-    conn = connect_to_db()
+    conn = connect_to_db(autocommit=True)
     if not conn:
         return []
 
-    cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-    sql = """
-        SELECT
-            paper_hash,
-            id,
-            title,
-            abstract,
-            authors,
-            publication_date,
-            landing_page_url,
-            pdf_url,
-            similarity_score,
-            fwci,
-            citation_normalized_percentile,
-            cited_by_count,
-            counts_by_year,
-            venue_name,
-            venue_type,
-            is_oa,
-            oa_status,
-            oa_url
-        FROM papers_table
-        WHERE paper_hash = ANY(%s);
-    """
+    cur = conn.cursor()
+    sql = _SELECT_PAPERS_BY_HASH_SQL
 
     try:
         cur.execute(sql, (paper_hashes_to_find,))
-        papers_dict = {row["paper_hash"]: dict(row) for row in cur.fetchall()}
-
-        # Preserve the order of the input hashes
-        papers = []
-        for hash_value in paper_hashes_to_find:
-            if hash_value in papers_dict:
-                papers.append(papers_dict[hash_value])
-
-        return papers
+        # Plain tuples zipped against the fixed column list avoid building a
+        # DictRow per result before converting it to a dict anyway.
+        return [dict(zip(_PAPER_COLUMNS, row)) for row in cur.fetchall()]
     except psycopg2.Error as e:
-        print(f"Error fetching papers by hashes {paper_hashes_to_find}: {e}")
+        logger.error("Error fetching papers by hashes %s: %s", paper_hashes_to_find, e)
         return []
     finally:
         cur.close()
@@ -341,7 +517,7 @@ def update_paper(old_paper_hash, update_data):
         Inserts a new version of the paper and deletes the old version in the database.
     """
     if not update_data:
-        print("No data provided for paper update.")
+        logger.warning("No data provided for paper update.")
         return False
 
     conn = connect_to_db()
@@ -351,112 +527,79 @@ def update_paper(old_paper_hash, update_data):
     cur = conn.cursor()
 
     try:
-        cur.execute(
-            "SELECT id, title, abstract, authors, publication_date, landing_page_url, pdf_url FROM papers_table WHERE paper_hash = %s;",
-            (old_paper_hash,),
-        )
+        cur.execute(_SELECT_UPDATABLE_FIELDS_SQL, (old_paper_hash,))
         current_paper_tuple = cur.fetchone()
 
         if not current_paper_tuple:
-            print(f"No paper found with hash {old_paper_hash} to update.")
+            logger.warning("No paper found with hash %s to update.", old_paper_hash)
             return False
 
-        current_paper_data = {
-            "id": current_paper_tuple[0],
-            "title": current_paper_tuple[1],
-            "abstract": current_paper_tuple[2],
-            "authors": current_paper_tuple[3],
-            "publication_date": current_paper_tuple[4],
-            "landing_page_url": current_paper_tuple[5],
-            "pdf_url": current_paper_tuple[6],
-        }
-
-        updated_paper_data = current_paper_data.copy()
-
-        allowed_fields = [
-            "id",
-            "title",
-            "abstract",
-            "authors",
-            "publication_date",
-            "landing_page_url",
-            "pdf_url",
-        ]
+        updated_paper_data = dict(zip(_UPDATABLE_PAPER_FIELDS, current_paper_tuple))
 
         valid_update_applied = False
         for key, value in update_data.items():
-            if key in allowed_fields:
-                if key == "publication_date" and (value == "" or value is None):
-                    updated_paper_data[key] = None
-                else:
-                    updated_paper_data[key] = value
+            if key in updated_paper_data:
+                updated_paper_data[key] = value
                 valid_update_applied = True
             else:
-                print(
-                    f"Warning: Field '{key}' is not an allowed paper field for update and will be ignored."
+                logger.warning(
+                    "Field '%s' is not an allowed paper field for update and will be ignored.",
+                    key,
                 )
 
         if not valid_update_applied:
-            print("No valid fields provided for update.")
+            logger.warning("No valid fields provided for update.")
 
             return True
 
         new_hash = _generate_paper_hash(updated_paper_data)
 
         if new_hash == old_paper_hash:
-            print(
-                f"Update for paper hash {old_paper_hash} resulted in no change to content hash. No DB modification needed."
+            logger.info(
+                "Update for paper hash %s resulted in no change to content hash. No DB modification needed.",
+                old_paper_hash,
             )
             return True
 
-        insert_sql = """
-            INSERT INTO papers_table (paper_hash, id, title, abstract, authors, publication_date, landing_page_url, pdf_url)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (paper_hash) DO NOTHING;
-        """
-
-        cur.execute(
-            insert_sql,
-            (
-                new_hash,
-                updated_paper_data["id"],
-                updated_paper_data["title"],
-                updated_paper_data.get("abstract"),
-                updated_paper_data.get("authors"),
-                updated_paper_data.get("publication_date"),
-                updated_paper_data.get("landing_page_url"),
-                updated_paper_data.get("pdf_url"),
-            ),
-        )
+        cur.execute(_INSERT_UPDATED_PAPER_SQL, (new_hash, *updated_paper_data.values()))
 
         rows_inserted = cur.rowcount
         if rows_inserted == 0 and new_hash != old_paper_hash:
-            print(
-                f"Updated state for paper (old hash {old_paper_hash}) results in new hash {new_hash}, which already exists in the DB."
+            logger.info(
+                "Updated state for paper (old hash %s) results in new hash %s, which already exists in the DB.",
+                old_paper_hash,
+                new_hash,
             )
 
         delete_sql = "DELETE FROM papers_table WHERE paper_hash = %s;"
         cur.execute(delete_sql, (old_paper_hash,))
 
         if cur.rowcount == 0:
-            print(
-                f"Warning: Paper with old hash {old_paper_hash} was not found for deletion after update attempt. This might be okay if the new state's hash ({new_hash}) was identical and already existed."
+            logger.warning(
+                "Paper with old hash %s was not found for deletion after update attempt. This might be okay if the new state's hash (%s) was identical and already existed.",
+                old_paper_hash,
+                new_hash,
             )
 
         conn.commit()
-        print(
-            f"Paper with old hash {old_paper_hash} processed for update. New effective hash is {new_hash}."
+        _invalidate_cached_paper(old_paper_hash)
+        logger.info(
+            "Paper with old hash %s processed for update. New effective hash is %s.",
+            old_paper_hash,
+            new_hash,
         )
         return True
 
     except psycopg2.Error as e:
-        print(f"Error updating paper with old hash {old_paper_hash}: {e}")
+        logger.error("Error updating paper with old hash %s: %s", old_paper_hash, e)
         if conn:
             conn.rollback()
         return False
     except Exception as ex:
-        print(
-            f"An unexpected error occurred while updating paper {old_paper_hash}: {ex}"
+        logger.error(
+            "An unexpected error occurred while updating paper %s: %s",
+            old_paper_hash,
+            ex,
         )
         if conn:
             conn.rollback()
@@ -479,17 +622,8 @@ def update_paper_field(old_paper_hash, field_name, new_value):
         bool: True if update was successful, False otherwise.
     """
 
-    allowed_fields = [
-        "id",
-        "title",
-        "abstract",
-        "authors",
-        "publication_date",
-        "landing_page_url",
-        "pdf_url",
-    ]
-    if field_name not in allowed_fields:
-        print(f"Error: '{field_name}' is not an updatable field for a paper.")
+    if field_name not in _UPDATABLE_PAPER_FIELD_SET:
+        logger.error("'%s' is not an updatable field for a paper.", field_name)
         return False
     return update_paper(old_paper_hash, {field_name: new_value})
 
@@ -513,13 +647,16 @@ def delete_paper_by_hash(paper_hash_to_delete):
     try:
         cur.execute(sql, (paper_hash_to_delete,))
         conn.commit()
+        _invalidate_cached_paper(paper_hash_to_delete)
         if cur.rowcount == 0:
-            print(f"No paper found with hash {paper_hash_to_delete} to delete.")
+            logger.warning(
+                "No paper found with hash %s to delete.", paper_hash_to_delete
+            )
             return False
-        print(f"Paper with hash {paper_hash_to_delete} deleted successfully.")
+        logger.info("Paper with hash %s deleted successfully.", paper_hash_to_delete)
         return True
     except psycopg2.Error as e:
-        print(f"Error deleting paper with hash {paper_hash_to_delete}: {e}")
+        logger.error("Error deleting paper with hash %s: %s", paper_hash_to_delete, e)
         conn.rollback()
         return False
     finally:
@@ -539,45 +676,47 @@ def list_tables_and_columns():
 
     cur = conn.cursor()
     try:
-        cur.execute("""
-            SELECT table_name
-            FROM information_schema.tables
-            WHERE table_schema = 'public' AND table_name = 'papers_table' -- Focus on papers_table
-            ORDER BY table_name;
-            """)
-        tables = cur.fetchall()
-        if not tables:
+        # One round-trip: an empty column list means the table does not exist.
+        # pg_catalog directly: the information_schema views wrap these same tables
+        # in several layers of joins and privilege checks.
+        cur.execute(
+            """
+            SELECT a.attname,
+                   format_type(a.atttypid, a.atttypmod),
+                   CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END,
+                   pg_get_expr(ad.adbin, ad.adrelid),
+                   con.conname,
+                   CASE con.contype
+                       WHEN 'p' THEN 'PRIMARY KEY'
+                       WHEN 'u' THEN 'UNIQUE'
+                       WHEN 'f' THEN 'FOREIGN KEY'
+                   END
+            FROM pg_catalog.pg_attribute a
+            LEFT JOIN pg_catalog.pg_attrdef ad
+              ON ad.adrelid = a.attrelid AND ad.adnum = a.attnum
+            LEFT JOIN pg_catalog.pg_constraint con
+              ON con.conrelid = a.attrelid
+              AND a.attnum = ANY (con.conkey)
+              AND con.contype IN ('p', 'u', 'f')
+            WHERE a.attrelid = to_regclass('public.papers_table')
+              AND a.attnum > 0
+              AND NOT a.attisdropped
+            ORDER BY a.attnum;
+            """
+        )
+        columns = cur.fetchall()
+        if not columns:
             print("Table 'papers_table' not found in 'public' schema.")
             return
 
         print("Schema for 'papers_table':")
-        for table in tables:
-            table_name = table[0]
-            cur.execute(
-                """
-                SELECT c.column_name, c.data_type, c.is_nullable, c.column_default,
-                       tc.constraint_name, tc.constraint_type
-                FROM information_schema.columns c
-                LEFT JOIN information_schema.key_column_usage kcu
-                  ON c.table_schema = kcu.table_schema
-                  AND c.table_name = kcu.table_name
-                  AND c.column_name = kcu.column_name
-                LEFT JOIN information_schema.table_constraints tc
-                  ON kcu.constraint_schema = tc.constraint_schema
-                  AND kcu.constraint_name = tc.constraint_name
-                WHERE c.table_name = %s AND c.table_schema = 'public'
-                ORDER BY c.ordinal_position;
-                """,
-                (table_name,),
+        for column in columns:
+            constraint_info = ""
+            if column[4] and column[5]:  # constraint_name and constraint_type
+                constraint_info = f", Constraint: {column[4]} ({column[5]})"
+            print(
+                f"  - {column[0]} ({column[1]}, Nullable: {column[2]}, Default: {column[3]}{constraint_info})"
             )
-            columns = cur.fetchall()
-            for column in columns:
-                constraint_info = ""
-                if column[4] and column[5]:  # constraint_name and constraint_type
-                    constraint_info = f", Constraint: {column[4]} ({column[5]})"
-                print(
-                    f"  - {column[0]} ({column[1]}, Nullable: {column[2]}, Default: {column[3]}{constraint_info})"
-                )
     except psycopg2.Error as e:
         print(f"Error listing tables and columns: {e}")
     finally:
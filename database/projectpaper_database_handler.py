@@ -11,8 +11,8 @@ All project-paper operations are designed to be robust, transactional, and reusa
 
 import psycopg2
 import psycopg2.extras
-from database.database_connection import connect_to_db
-from datetime import datetime, timedelta
+from database.database_connection import connect_to_db, db_connection
+from datetime import datetime, timedelta, timezone
 
 
 def assign_paper_to_project(
@@ -52,6 +52,40 @@ def assign_paper_to_project(
     connection.close()
 
 
+def assign_papers_to_project(project_id: str, papers: list[dict]):
+    """
+    Link several papers to a project in one batched upsert.
+    Args:
+        project_id (str): The project's id.
+        papers (list[dict]): Dicts with 'paper_hash' and 'summary' for each paper.
+    Returns:
+        None
+    Side effects:
+        Inserts or updates rows in paperprojects_table in a single transaction.
+    """
+    if not papers:
+        return
+
+    # One row per hash (last summary wins, as with repeated single upserts);
+    # ON CONFLICT DO UPDATE cannot touch the same row twice in one statement.
+    summaries = {paper["paper_hash"]: paper["summary"] for paper in papers}
+    values = [
+        (project_id, paper_hash, summary, False, False, False)
+        for paper_hash, summary in summaries.items()
+    ]
+
+    with db_connection() as connection, connection.cursor() as cursor:
+        psycopg2.extras.execute_values(
+            cursor,
+            """INSERT INTO paperprojects_table (project_id, paper_hash, summary, newsletter, seen, is_replacement) VALUES %s
+                      ON CONFLICT (project_id, paper_hash)
+                      DO UPDATE SET summary = EXCLUDED.summary, is_replacement = EXCLUDED.is_replacement
+            """,
+            values,
+        )
+        connection.commit()
+
+
 def get_papers_for_project(project_id: str):
     """
     Retrieve the list of papers for a project, excluding pubsub papers.
@@ -60,40 +94,31 @@ def get_papers_for_project(project_id: str):
     Returns:
         list[dict]: List of dicts with paper metadata and relevance summary.
     """
-    connection = connect_to_db()
-    cursor = connection.cursor(cursor_factory=psycopg2.extras.DictCursor)
-    cursor.execute(
-        """
-                   SELECT papers_table.*, paperprojects_table.rating, paperprojects_table.is_replacement
-                   FROM papers_table
-                            JOIN paperprojects_table ON papers_table.paper_hash = paperprojects_table.paper_hash
-                   WHERE paperprojects_table.project_id = %s
-                     AND paperprojects_table.excluded = FALSE
-                     AND paperprojects_table.newsletter = FALSE
-                   """,
-        (project_id,),
-    )
-    papers = cursor.fetchall()
-    results = []
-    for paper in papers:
-        paper_dict = {}
+    # The summary lives on the same paperprojects_table row as the rating, so it
+    # comes back with the join instead of one extra SELECT per paper.
+    with db_connection(autocommit=True) as connection:
+        cursor = connection.cursor(cursor_factory=psycopg2.extras.DictCursor)
         cursor.execute(
             """
-                       SELECT summary
-                       FROM paperprojects_table
-                       WHERE paper_hash = %s
-                         AND project_id = %s
+                       SELECT papers_table.paper_hash, paperprojects_table.rating,
+                              paperprojects_table.is_replacement, paperprojects_table.summary
+                       FROM papers_table
+                                JOIN paperprojects_table ON papers_table.paper_hash = paperprojects_table.paper_hash
+                       WHERE paperprojects_table.project_id = %s
+                         AND paperprojects_table.excluded = FALSE
+                         AND paperprojects_table.newsletter = FALSE
                        """,
-            (paper["paper_hash"], project_id),
+            (project_id,),
         )
-
-        summary_row = cursor.fetchone()
-        paper_dict["paper_hash"] = dict(paper)["paper_hash"]
-        paper_dict["rating"] = paper["rating"]
-        paper_dict["is_replacement"] = paper["is_replacement"]
-        if summary_row:
-            paper_dict["summary"] = summary_row[0]
-        print(paper_dict)
+        papers = cursor.fetchall()
+    results = []
+    for paper in papers:
+        paper_dict = {
+            "paper_hash": paper["paper_hash"],
+            "rating": paper["rating"],
+            "is_replacement": paper["is_replacement"],
+            "summary": paper["summary"],
+        }
         results.append(paper_dict)
     print("Successfully converted papers to dict")
     return results
@@ -199,8 +224,7 @@ def should_update(project_id: str, days_for_update: int | float) -> bool:
     Returns:
         bool: True if update is needed, False otherwise.
     """
-    conn = connect_to_db()
-    with conn.cursor() as cur:
+    with db_connection(autocommit=True) as conn, conn.cursor() as cur:
         cur.execute(
             """
             SELECT creation_date
@@ -219,8 +243,10 @@ def should_update(project_id: str, days_for_update: int | float) -> bool:
         return True
 
     latest_date = row[0]
-    # Use matching timezone if the column is tz-aware, else UTC
-    now = datetime.now(latest_date.tzinfo) if latest_date.tzinfo else datetime.utcnow()
+    # Use matching timezone if the column is tz-aware, else naive UTC
+    now = datetime.now(latest_date.tzinfo or timezone.utc)
+    if latest_date.tzinfo is None:
+        now = now.replace(tzinfo=None)
     return now - latest_date >= timedelta(days=days_for_update)
 
 
@@ -235,8 +261,7 @@ def mark_paper_seen(project_id: str, paper_hash: str) -> bool:
     Side effects:
         Updates the seen field in paperprojects_table.
     """
-    conn = connect_to_db()
-    with conn.cursor() as cur:
+    with db_connection() as conn, conn.cursor() as cur:
         cur.execute(
             """
             UPDATE public.paperprojects_table
@@ -247,8 +272,8 @@ def mark_paper_seen(project_id: str, paper_hash: str) -> bool:
         )
         updated = cur.rowcount  # number of rows affected
 
-    # Commit the change—remove this if you're running with autocommit = True
-    conn.commit()
+        # Commit the change—remove this if you're running with autocommit = True
+        conn.commit()
 
     return updated == 1
 
@@ -263,8 +288,7 @@ def delete_project_rows(project_id: str) -> int:
     Side effects:
         Removes rows from paperprojects_table.
     """
-    conn = connect_to_db()
-    with conn.cursor() as cur:
+    with db_connection() as conn, conn.cursor() as cur:
         cur.execute(
             """
             DELETE FROM public.paperprojects_table
@@ -274,5 +298,5 @@ def delete_project_rows(project_id: str) -> int:
         )
         deleted = cur.rowcount  # rows affected
 
-    conn.commit()  # omit if autocommit=True
+        conn.commit()  # omit if autocommit=True
     return deleted
@@ -18,7 +18,7 @@ import psycopg2.extras
 from flask import request
 
 from utils.status import Status
-from database.database_connection import connect_to_db
+from database.database_connection import connect_to_db, db_connection
 
 logger = logging.getLogger(__name__)
 
@@ -198,24 +198,22 @@ def get_queries_for_project(project_id: str):
     Returns:
         list or None: The list of queries, or None if not found.
     """
-    conn = connect_to_db()
-    cursor = conn.cursor()
-
     if not request.auth:
         raise Exception("Not authenticated")
 
     user_id = request.auth["user_id"]
 
-    cursor.execute(
-        """ 
-    SELECT queries 
-    FROM projects_table 
-    WHERE project_id = %s AND user_id = %s""",
-        (project_id, user_id),
-    )
+    with db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(
+            """ 
+        SELECT queries 
+        FROM projects_table 
+        WHERE project_id = %s AND user_id = %s""",
+            (project_id, user_id),
+        )
 
-    queries = cursor.fetchone()
-    return queries
+        queries = cursor.fetchone()
+        return queries
 
 
 def get_project_prompt(project_id: str):
@@ -226,23 +224,21 @@ def get_project_prompt(project_id: str):
     Returns:
         str or None: The project description, or None if not found.
     """
-    conn = connect_to_db()
-    cursor = conn.cursor()
-
     if not request.auth:
         raise Exception("Not authenticated")
 
     user_id = request.auth["user_id"]
 
-    cursor.execute(
-        """ SELECT description
-                       FROM projects_table
-                       WHERE project_id = %s AND user_id = %s""",
-        (project_id, user_id),
-    )
+    with db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(
+            """ SELECT description
+                           FROM projects_table
+                           WHERE project_id = %s AND user_id = %s""",
+            (project_id, user_id),
+        )
 
-    prompt = cursor.fetchone()
-    return prompt
+        prompt = cursor.fetchone()
+        return prompt
 
 
 def get_all_projects() -> list[dict]:
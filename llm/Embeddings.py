@@ -16,6 +16,9 @@ from langchain_core.messages import HumanMessage
 client = OpenAI(api_key=OPENAI_API_KEY)
 logger = logging.getLogger(__name__)
 
+# Maximum number of texts sent in a single embeddings request.
+EMBEDDING_BATCH_SIZE = 256
+
 
 def embed_string(text, model="text-embedding-3-small"):
     """
@@ -53,6 +56,36 @@ def embed_papers(title, abstract):
     return embed_string(title + abstract)
 
 
+def embed_papers_batch(titles, abstracts, model="text-embedding-3-small"):
+    """
+    Embed many papers with as few embedding API calls as possible.
+    Args:
+        titles (list[str]): The paper titles.
+        abstracts (list[str]): The paper abstracts, aligned with titles.
+        model (str): The embedding model to use (default: 'text-embedding-3-small').
+    Returns:
+        list[list[float]]: One embedding vector per paper, in input order.
+    Side effects:
+        Papers with identical title and abstract (e.g. preprint and published
+        versions) are embedded only once and share the resulting vector.
+    """
+    texts = [
+        (title + abstract).replace("\n", " ")
+        for title, abstract in zip(titles, abstracts)
+    ]
+    unique_texts = list(dict.fromkeys(texts))
+
+    unique_embeddings = []
+    for start in range(0, len(unique_texts), EMBEDDING_BATCH_SIZE):
+        response = client.embeddings.create(
+            input=unique_texts[start : start + EMBEDDING_BATCH_SIZE], model=model
+        )
+        unique_embeddings.extend(item.embedding for item in response.data)
+
+    embedding_by_text = dict(zip(unique_texts, unique_embeddings))
+    return [embedding_by_text[text] for text in texts]
+
+
 def embed_paper_text(paper_text: str) -> list[float]:
     """
     Embed paper text, summarizing if too long for the embedding model.
@@ -17,6 +17,8 @@ The agent is designed to be modular, extensible, and easy to debug or extend for
 
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # from langgraph.graph import StateGraph
 # from langchain_core.messages import HumanMessage
@@ -39,6 +41,16 @@ logger = logging.getLogger("StategraphAgent")
 logger.setLevel(logging.INFO)
 
 
+@lru_cache(maxsize=1)
+def _get_tool_map():
+    """
+    Build the tool lookup used by the nodes once; the registered tool list is static.
+    Returns:
+        dict: Mapping of tool name to tool object.
+    """
+    return {getattr(tool, "name", None): tool for tool in get_tools()}
+
+
 def node_logger(node_name, input_keys=None, output_keys=None):
     """
     Decorator for logging input and output of stategraph agent nodes.
@@ -99,10 +111,10 @@ def input_node(state):
     user_query = state["user_query"]
     # Extract project_id if appended to the user_query (e.g., '... project ID: <id>')
     project_id = None
-    if "project ID:" in user_query:
-        parts = user_query.rsplit("project ID:", 1)
-        user_query = parts[0].strip()
-        project_id = parts[1].strip()
+    head, marker, tail = user_query.rpartition("project ID:")
+    if marker:
+        user_query = head.strip()
+        project_id = tail.strip()
     # If the query is a single word or phrase, use it as the initial keyword
     keywords = []
     if user_query and len(user_query.split()) == 1:
@@ -134,12 +146,7 @@ def out_of_scope_check_node(state):
         dict: Updated state with out_of_scope_result.
     """
     # Get the detect_out_of_scope_query tool
-    tools = get_tools()
-    detect_out_of_scope_query = None
-    for tool in tools:
-        if hasattr(tool, "name") and tool.name == "detect_out_of_scope_query":
-            detect_out_of_scope_query = tool
-            break
+    detect_out_of_scope_query = _get_tool_map().get("detect_out_of_scope_query")
     if detect_out_of_scope_query is None:
         state["error"] = "detect_out_of_scope_query tool not found"
         return state
@@ -155,6 +162,68 @@ def out_of_scope_check_node(state):
 # --- Quality Control Node (QC) ---
 
 
+def _detect_filter_instructions(user_query):
+    """
+    Ask the LLM whether the user query contains filter instructions.
+    Args:
+        user_query (str): The user's research query.
+    Returns:
+        bool: True if filter instructions were detected, False otherwise (including on errors).
+    """
+    filter_detection_prompt = f"""
+    You are an academic research assistant. Analyze the user query to determine if it contains filter instructions.
+
+    Filter instructions include:
+    - Date/time constraints: "after 2020", "before 2018", "published since 2022", "between 2019-2023"
+    - Citation constraints: "highly cited", "more than 50 citations", "well-cited papers"
+    - Author constraints: "by author X", "from researcher Y", "authored by"
+    - Journal/conference constraints: "published in Nature", "from conference X", "in journal Y"
+    - Impact constraints: "high impact", "top journals", "prestigious venues"
+    - Similarity constraints: "highly relevant", "closely related", "similar to"
+    - Specific metrics: "fwci > 5", "citation percentile > 90", "impact factor > 10"
+
+    User query: "{user_query}"
+
+    Respond with ONLY a JSON object:
+    {{
+    "has_filter_instructions": true/false,
+    "reason": "brief explanation of why"
+    }}
+    """
+
+    try:
+        filter_response = LLM.invoke(filter_detection_prompt)
+        filter_response_content = (
+            filter_response.content
+            if hasattr(filter_response, "content")
+            else str(filter_response)
+        )
+        filter_result = (
+            json.loads(filter_response_content)
+            if isinstance(filter_response_content, str)
+            else filter_response_content
+        )
+
+        # Handle potential list response
+        if isinstance(filter_result, list) and len(filter_result) > 0:
+            filter_result = filter_result[0]
+
+        has_filter_instructions = False
+        reason = "No reason provided"
+        if isinstance(filter_result, dict):
+            has_filter_instructions = filter_result.get(
+                "has_filter_instructions", False
+            )
+            reason = filter_result.get("reason", "No reason provided")
+
+        logger.info(f"Filter detection: {has_filter_instructions} - {reason}")
+        return has_filter_instructions
+
+    except Exception as e:
+        logger.error(f"Error in filter detection: {e}")
+        return False
+
+
 @node_logger(
     "quality_control",
     input_keys=["user_query", "out_of_scope_result", "keywords"],
@@ -173,8 +242,7 @@ def quality_control_node(state):
     Returns:
         dict: Updated state with QC decision, tool result, keywords, and filter instructions flag.
     """
-    tools = get_tools()
-    tool_map = {getattr(tool, "name", None): tool for tool in tools}
+    tool_map = _get_tool_map()
     qc_decision = "accept"  # Default
     qc_tool_result = None
     try:
@@ -202,60 +270,6 @@ def quality_control_node(state):
         # Update keywords in state
         state["keywords"] = keywords
 
-        # Use LLM to intelligently detect filter instructions
-        filter_detection_prompt = f"""
-        You are an academic research assistant. Analyze the user query to determine if it contains filter instructions.
-
-        Filter instructions include:
-        - Date/time constraints: "after 2020", "before 2018", "published since 2022", "between 2019-2023"
-        - Citation constraints: "highly cited", "more than 50 citations", "well-cited papers"
-        - Author constraints: "by author X", "from researcher Y", "authored by"
-        - Journal/conference constraints: "published in Nature", "from conference X", "in journal Y"
-        - Impact constraints: "high impact", "top journals", "prestigious venues"
-        - Similarity constraints: "highly relevant", "closely related", "similar to"
-        - Specific metrics: "fwci > 5", "citation percentile > 90", "impact factor > 10"
-
-        User query: "{user_query}"
-
-        Respond with ONLY a JSON object:
-        {{
-        "has_filter_instructions": true/false,
-        "reason": "brief explanation of why"
-        }}
-        """
-
-        try:
-            filter_response = LLM.invoke(filter_detection_prompt)
-            filter_response_content = (
-                filter_response.content
-                if hasattr(filter_response, "content")
-                else str(filter_response)
-            )
-            filter_result = (
-                json.loads(filter_response_content)
-                if isinstance(filter_response_content, str)
-                else filter_response_content
-            )
-
-            # Handle potential list response
-            if isinstance(filter_result, list) and len(filter_result) > 0:
-                filter_result = filter_result[0]
-
-            has_filter_instructions = False
-            reason = "No reason provided"
-            if isinstance(filter_result, dict):
-                has_filter_instructions = filter_result.get(
-                    "has_filter_instructions", False
-                )
-                reason = filter_result.get("reason", "No reason provided")
-
-            state["has_filter_instructions"] = has_filter_instructions
-            logger.info(f"Filter detection: {has_filter_instructions} - {reason}")
-
-        except Exception as e:
-            logger.error(f"Error in filter detection: {e}")
-            state["has_filter_instructions"] = False
-
         # LLM-driven QC decision
         qc_prompt = f"""
         You are an academic research assistant. Given the following user query and keywords, decide which action to take:
@@ -275,7 +289,13 @@ def quality_control_node(state):
         "reason": "..."
         }}
         """
-        qc_response = LLM.invoke(qc_prompt)
+        # Filter detection only depends on the query, so it runs alongside the QC call
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            filter_future = executor.submit(_detect_filter_instructions, user_query)
+            try:
+                qc_response = LLM.invoke(qc_prompt)
+            finally:
+                state["has_filter_instructions"] = filter_future.result()
         qc_response_content = (
             qc_response.content if hasattr(qc_response, "content") else str(qc_response)
         )
@@ -496,8 +516,7 @@ def update_papers_by_project_node(state):
     Returns:
         dict: Updated state with update_papers_by_project_result.
     """
-    tools = get_tools()
-    tool_map = {getattr(tool, "name", None): tool for tool in tools}
+    tool_map = _get_tool_map()
     update_papers_for_project_tool = tool_map.get("update_papers_for_project")
     logger.info(f"Available tool names: {list(tool_map.keys())}")
     logger.info(
@@ -522,11 +541,12 @@ def update_papers_by_project_node(state):
         else:
             # Fallback: single query as before
             queries = []
-            if state.get("qc_decision") == "reformulate" and state.get(
-                "qc_tool_result"
-            ):
+            qc_decision = state.get("qc_decision")
+            qc_tool_result = state.get("qc_tool_result")
+            user_query = state.get("user_query", "")
+            if qc_decision == "reformulate" and qc_tool_result:
                 try:
-                    qc_result = json.loads(state["qc_tool_result"])
+                    qc_result = json.loads(qc_tool_result)
                     if (
                         "result" in qc_result
                         and "refined_keywords" in qc_result["result"]
@@ -535,16 +555,13 @@ def update_papers_by_project_node(state):
                     elif "reformulated_description" in qc_result:
                         queries = [qc_result["reformulated_description"]]
                 except Exception:
-                    queries = [state.get("user_query", "")]
-            elif state.get("qc_decision") == "split" and state.get("qc_tool_result"):
+                    queries = [user_query]
+            elif qc_decision == "split" and qc_tool_result:
                 # Should not happen, handled above
-                queries = [state.get("user_query", "")]
+                queries = [user_query]
             else:
                 # Use keywords if available, otherwise fall back to user query
-                if state.get("keywords"):
-                    queries = state["keywords"]
-                else:
-                    queries = [state.get("user_query", "")]
+                queries = state.get("keywords") or [user_query]
             if update_papers_for_project_tool and project_id:
                 logger.info(
                     f"Calling update_papers_for_project with queries: {queries} and project_id: {project_id}"
@@ -578,8 +595,7 @@ def get_best_papers_node(state):
     Returns:
         dict: Updated state with papers_raw.
     """
-    tools = get_tools()
-    tool_map = {getattr(tool, "name", None): tool for tool in tools}
+    tool_map = _get_tool_map()
     get_best_papers_tool = tool_map.get("get_best_papers")
     papers_raw = []
     try:
@@ -623,8 +639,7 @@ def filter_papers_node(state):
     Returns:
         dict: Updated state with papers_filtered.
     """
-    tools = get_tools()
-    tool_map = {getattr(tool, "name", None): tool for tool in tools}
+    tool_map = _get_tool_map()
     filter_tool = tool_map.get("filter_papers_by_nl_criteria")
     papers_filtered = []
 
@@ -710,8 +725,7 @@ def no_results_handler_node(state):
     filter_criteria_json = state.get("applied_filter_criteria", {})
 
     # Use the tool to get closest values and directions
-    tools = get_tools()
-    tool_map = {getattr(tool, "name", None): tool for tool in tools}
+    tool_map = _get_tool_map()
     closest_tool = tool_map.get("find_closest_paper_metrics")
     closest_values = {}
     if closest_tool:
@@ -782,17 +796,24 @@ def store_papers_for_project_node(state):
     Returns:
         dict: Updated state with store_papers_for_project_result.
     """
-    tools = get_tools()
-    tool_map = {getattr(tool, "name", None): tool for tool in tools}
+    tool_map = _get_tool_map()
     store_papers_for_project_tool = tool_map.get("store_papers_for_project")
     # Use filtered papers if available, else raw
     project_id = state.get("project_id")
     papers = state.get("papers_filtered") or state.get("papers_raw") or []
+    # Nothing will be stored, so skip the per-paper summary LLM calls
+    if not (store_papers_for_project_tool and project_id and papers):
+        state["store_papers_for_project_result"] = (
+            "No papers to store or missing project_id."
+        )
+        return state
     user_query = state.get("user_query", "")
     # Prepare papers for storage: must include paper_hash and agent_summary
     papers_to_store = []
     for paper in papers:
         paper_hash = paper.get("hash") or paper.get("paper_hash")
+        if not paper_hash:
+            continue
         title = paper.get("title", "")
         abstract = paper.get("abstract", "")
         # Use the tool version (invoke as a tool)
@@ -802,10 +823,9 @@ def store_papers_for_project_node(state):
             )
         except Exception:
             summary = f"Relevant to project query: {user_query}"
-        if paper_hash:
-            papers_to_store.append({"paper_hash": paper_hash, "summary": summary})
+        papers_to_store.append({"paper_hash": paper_hash, "summary": summary})
     result = None
-    if store_papers_for_project_tool and project_id and papers_to_store:
+    if papers_to_store:
         result = store_papers_for_project_tool.invoke(
             {"project_id": project_id, "papers": papers_to_store}
         )
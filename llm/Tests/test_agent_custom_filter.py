@@ -0,0 +1,52 @@
+import operator
+
+import pytest
+
+from llm.util.agent_custom_filter import _coerce, _compile_filter
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2023", 2023),
+        ("2021-06-30", 2021),
+        ("2021-6-30", "2021-6-30"),
+        ("20234", "20234"),
+        ("abcd", "abcd"),
+        (None, None),
+        (7.5, 7.5),
+    ],
+)
+def test_coerce_turns_years_and_dates_into_year_ints(value, expected):
+    assert _coerce(value) == expected
+
+
+def test_compiled_filter_compares_dates_by_year():
+    [(_, at_least, year)] = _compile_filter(
+        {"publication_date": {"op": ">=", "value": "2022"}}
+    )
+    [(_, after, later_year)] = _compile_filter(
+        {"publication_date": {"op": ">", "value": 2020}}
+    )
+
+    assert at_least(_coerce("2022-03-01"), year)
+    assert not after(_coerce("2019-12-31"), later_year)
+
+
+def test_compile_filter_resolves_operator_and_coerces_target_once():
+    rules = _compile_filter(
+        {
+            "publication_date": {"op": ">=", "value": "2020-01-01"},
+            "fwci": {"op": ">", "value": 1},
+        }
+    )
+
+    assert rules == [
+        ("publication_date", operator.ge, 2020),
+        ("fwci", operator.gt, 1),
+    ]
+
+
+def test_compile_filter_rejects_unknown_operator():
+    with pytest.raises(ValueError):
+        _compile_filter({"fwci": {"op": "~", "value": 1}})
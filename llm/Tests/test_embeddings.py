@@ -0,0 +1,26 @@
+from unittest.mock import MagicMock, patch
+
+from llm import Embeddings
+
+
+def test_embed_papers_batch_embeds_duplicate_texts_once():
+    """
+    Papers sharing the same title and abstract are sent to the embedding API only once,
+    but every input position still receives its embedding.
+    """
+    mock_client = MagicMock()
+    mock_client.embeddings.create.side_effect = lambda input, model: MagicMock(
+        data=[MagicMock(embedding=[float(len(text))]) for text in input]
+    )
+
+    with patch.object(Embeddings, "client", mock_client):
+        result = Embeddings.embed_papers_batch(
+            ["A", "Bb", "A"], ["abstract", "abstract", "abstract"]
+        )
+
+    assert result == [[9.0], [10.0], [9.0]]
+    mock_client.embeddings.create.assert_called_once()
+    assert mock_client.embeddings.create.call_args.kwargs["input"] == [
+        "Aabstract",
+        "Bbabstract",
+    ]
@@ -0,0 +1,67 @@
+import json
+from unittest.mock import MagicMock, patch
+
+from llm.tools import paper_handling_tools as tools
+
+
+def _chunks(*parts):
+    for part in parts:
+        yield MagicMock(content=part)
+
+
+def test_read_json_object_from_stream_stops_at_closing_brace():
+    """
+    The first balanced JSON object is returned as soon as it is complete, even when the
+    model wraps it in a code fence or keeps generating text afterwards.
+    """
+    result = tools._read_json_object_from_stream(
+        _chunks('```json\n{"status": "va', 'lid", "reason": "a } {b"}', " trailing }")
+    )
+
+    assert json.loads(result) == {"status": "valid", "reason": "a } {b"}
+
+
+def test_detect_out_of_scope_query_parses_streamed_response():
+    """
+    detect_out_of_scope_query streams the LLM response and returns the parsed JSON object.
+    """
+    tools._classify_query_scope.cache_clear()
+    mock_llm = MagicMock()
+    mock_llm.stream.return_value = _chunks(
+        '{"status": "valid", "reason": "ok", ', '"keywords": ["graph neural networks"]}'
+    )
+
+    with patch.object(tools, "LLM", mock_llm):
+        result = json.loads(
+            tools.detect_out_of_scope_query.invoke(
+                {"query_description": "GNNs for molecules"}
+            )
+        )
+
+    assert result["status"] == "valid"
+    assert result["keywords"] == ["graph neural networks"]
+    mock_llm.invoke.assert_not_called()
+
+
+def test_detect_out_of_scope_query_reuses_result_for_same_query():
+    """
+    A repeated query is answered from the cache, while an unparsable reply is not cached.
+    """
+    tools._classify_query_scope.cache_clear()
+    mock_llm = MagicMock()
+    mock_llm.stream.side_effect = [
+        _chunks("not json"),
+        _chunks('{"status": "valid", "reason": "ok", "keywords": ["tsp"]}'),
+    ]
+
+    with patch.object(tools, "LLM", mock_llm):
+        first = json.loads(
+            tools.detect_out_of_scope_query.invoke({"query_description": "TSP"})
+        )
+        second = tools.detect_out_of_scope_query.invoke({"query_description": "TSP "})
+        third = tools.detect_out_of_scope_query.invoke({"query_description": "TSP"})
+
+    assert first["status"] == "error"
+    assert json.loads(second)["keywords"] == ["tsp"]
+    assert third == second
+    assert mock_llm.stream.call_count == 2
@@ -17,8 +17,10 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List
 
+import psycopg2
 from langchain_core.tools import tool
 
 from chroma_db.chroma_vector_db import chroma_db
@@ -26,6 +28,7 @@ from database.database_connection import connect_to_db
 from database.papers_database_handler import insert_papers
 from database.projectpaper_database_handler import (
     assign_paper_to_project,
+    assign_papers_to_project,
     get_papers_for_project,
 )
 from database.projects_database_handler import (
@@ -33,9 +36,9 @@ from database.projects_database_handler import (
     get_project_data,
     get_user_profile_embedding,
 )
-from llm.Embeddings import embed_papers
+from llm.Embeddings import embed_papers_batch
 from llm.LLMDefinition import LLM
-from llm.util.agent_custom_filter import _matches, _OPERATORS
+from llm.util.agent_custom_filter import _coerce, _compile_filter, _OPERATORS
 from paper_handling.paper_handler import (
     fetch_works_multiple_queries,
     generate_paper_summary,
@@ -45,6 +48,96 @@ from utils.status import Status
 
 logger = logging.getLogger(__name__)
 
+# Prompt skeletons for the query-refinement tools. They are built once at import
+# time and filled in with str.format on each call (literal braces are escaped as {{ }}).
+_BROADEN_PROMPT = """
+    You are an academic research assistant helping users improve their scientific paper search using the OpenAlex API.
+
+    The user has provided:
+    - A natural language description of their research goal
+    - A small list of initial keywords they used to search for papers
+
+    Your task is to intelligently **broaden and optimize** the keyword list. Follow these rules:
+
+    1. Only suggest **2 to 4** high-quality keywords.
+    2. Prioritize **concepts or terms that would likely exist in academic knowledge graphs** (like OpenAlex).
+    3. Avoid exact duplicates or overly generic terms (e.g. "research", "science").
+    4. Prefer well-known **scientific disciplines**, **methods**, or **subfields** related to the original topic.
+    5. Assume the keywords will be used in a query like:
+    `filter=keywords.id:keyword1|keyword2|...` which uses AND matching — so do **not** add too many.
+
+    Respond only with a JSON list of new keywords (do not include the original ones), e.g.:
+    ["metabolomics", "cellular respiration", "photoperiodism"]
+
+    User research description: "{query_description}"
+
+    Original keywords: {keywords_json}
+
+    Broadened keyword list (JSON format only):
+    """
+
+_REFORMULATE_PROMPT = """
+    You are an AI-powered academic assistant helping researchers refine their literature search strategy using OpenAlex.
+
+    The user has submitted:
+    - A vague or imprecise research topic
+    - A list of keywords they initially used in the search
+
+    Your task is to **clarify the research intent** and **optimize the keyword list** so that:
+    1. The topic becomes academically precise and focused
+    2. The keywords are suitable for high-quality retrieval in OpenAlex
+
+    🔎 Guidelines for Keyword Optimization:
+    - Suggest only **2 to 4** highly relevant keywords
+    - Prefer keywords that match academic fields, subdisciplines, or research methods
+    - Avoid filler words, overly generic terms, or keyword duplication
+    - Assume the keywords will be used in a strict **AND** filter (i.e. all must be present), so select carefully to **maximize relevance while maintaining sufficient recall**
+
+    💡 Your goal is **focus**, not breadth. Do not add unrelated or tangential concepts.
+
+    Input:
+    - User query description: "{query_description}"
+    - Original keywords: {keywords_json}
+
+    Respond with a JSON object of the form:
+    {{
+    "reformulated_description": "More focused and academically clear version of the user's research goal",
+    "refined_keywords": ["...", "...", "..."]
+    }}
+    """
+
+_OUT_OF_SCOPE_PROMPT = """
+    You are a research paper search assistant.
+
+    Analyze the following user query and determine if it is a valid academic topic
+    for a scientific literature search or if it is out-of-scope (e.g., a greeting,
+    joke, personal opinion, or unrelated to science).
+
+    If the query contains an appended paper, extract keywords also based on the paper.
+
+    If the query is valid, extract a list of 2-5 concise, domain-relevant keyword phrases (each 2-4 words) that best capture the research intent.
+
+    Guidelines for keyword extraction:
+    - Prefer multi-word, context-rich phrases over single words, but keep each phrase concise (2-4 words).
+    - Avoid full sentences or overly detailed descriptions.
+    - Do NOT repeat the same context in every keyword (e.g., don't add "in digital health" to every phrase).
+    - Avoid generic or overly broad terms (e.g., "deep learning", "artificial intelligence", "healthcare").
+    - Do NOT simply list synonyms or related fields.
+    - Each keyword should be a phrase that could be used as a precise search query for this specific research interest.
+    - Focus on specificity and informativeness, not quantity.
+
+    Given the following research query, extract 2-5 highly relevant, expressive academic keyword phrases (each 2-4 words) that would maximize the quality of a literature search. Avoid generic terms, full sentences, and focus on specificity.
+
+    Query: "{query_description}"
+
+    Respond with a JSON object like:
+    {{
+        "status": "valid" | "out_of_scope",
+        "reason": "...",  // explanation for decision
+        "keywords": [ ... ] // list of keyword phrases (empty if out_of_scope)
+    }}
+    """
+
 
 @tool
 def store_papers_for_project(project_id: str, papers: list[dict]):
@@ -67,8 +160,7 @@ def store_papers_for_project(project_id: str, papers: list[dict]):
 
     """
     try:
-        for paper in papers:
-            assign_paper_to_project(paper["paper_hash"], project_id, paper["summary"])
+        assign_papers_to_project(project_id, papers)
     except Exception as e:
         logger.error(e)
         return "Failed to link papers to project"
@@ -144,67 +236,67 @@ def update_papers_for_project(queries: list[str], project_id: str) -> str:
     Returns:
         str: A human-readable summary of the update operation's result.
     """
-    try:
-        logger.info(
-            f"Starting update_papers_for_project with queries: {queries} and project_id: {project_id}"
-        )
-        fetched_papers, status_fetch = fetch_works_multiple_queries(queries)
-        logger.info(
-            f"Fetched {len(fetched_papers)} papers from OpenAlex, status: {status_fetch}"
-        )
+    logger.info(
+        f"Starting update_papers_for_project with queries: {queries} and project_id: {project_id}"
+    )
+    fetched_papers, status_fetch = fetch_works_multiple_queries(queries)
+    logger.info(
+        f"Fetched {len(fetched_papers)} papers from OpenAlex, status: {status_fetch}"
+    )
 
+    try:
         status_postgres, deduplicated_papers = insert_papers(fetched_papers)
-        logger.info(
-            f"Inserted {len(deduplicated_papers)} papers into database, status: {status_postgres}"
-        )
+    except psycopg2.Error as e:
+        logger.error(f"Inserting fetched papers failed: {e}")
+        status_postgres, deduplicated_papers = Status.FAILURE, []
+    logger.info(
+        f"Inserted {len(deduplicated_papers)} papers into database, status: {status_postgres}"
+    )
 
-        logger.info(f"Adding queries for project {project_id}")
+    logger.info(f"Adding queries for project {project_id}")
 
+    # Raises outside a request context, without auth, or when connecting fails.
+    try:
         status_queries = add_queries_to_project_db(queries, project_id)
+    except Exception as e:
+        logger.error(f"Storing queries for project {project_id} failed: {e}")
+        status_queries = Status.FAILURE
 
-        logger.info(f"Updated queries for project {project_id}")
+    logger.info(f"Updated queries for project {project_id}")
 
-        embedded_papers = []
-        logger.info(f"Creating embeddings for {len(deduplicated_papers)} papers")
-        for paper in deduplicated_papers:
-            embedding = embed_papers(paper["title"], paper["abstract"])
-            embedded_paper = {
-                "embedding": embedding,
-                "hash": paper["hash"],
-            }
-            embedded_papers.append(embedded_paper)
-
-        logger.info(f"Storing {len(embedded_papers)} embeddings in ChromaDB")
-        status_chroma = chroma_db.store_embeddings(embedded_papers)
-        logger.info(f"ChromaDB storage status: {status_chroma}")
-
-        if all(
-            [
-                status_queries == Status.SUCCESS,
-                status_fetch == Status.SUCCESS,
-                status_postgres == Status.SUCCESS,
-                status_chroma == Status.SUCCESS,
-            ]
-        ):
-            logger.info("Updating paper database successfully.")
-            return (
-                "Paper database has been updated with the latest papers & embeddings. There were no errors. "
-                "Now you can rank the papers."
-            )
-        else:
-            logger.error("Updating paper database failed.")
-            return (
-                "Paper database has been updated with the latest papers & embeddings. There were some errors. "
-                "Ignore the errors and proceed with ranking the papers."
-            )
-
-    except Exception as e:
-        logger.error(f"Updating paper database failed: {e}")
+    logger.info(f"Creating embeddings for {len(deduplicated_papers)} papers")
+    hashes = [paper["hash"] for paper in deduplicated_papers]
+    try:
+        embeddings = embed_papers_batch(
+            [paper["title"] for paper in deduplicated_papers],
+            [paper["abstract"] for paper in deduplicated_papers],
+        )
+    except Exception as e:  # API errors, but also malformed title/abstract values
+        logger.error(f"Embedding fetched papers failed: {e}")
+        status_chroma = Status.FAILURE
+    else:
+        logger.info(f"Storing {len(hashes)} embeddings in ChromaDB")
+        status_chroma = chroma_db.store_embeddings_columnar(hashes, embeddings)
+    logger.info(f"ChromaDB storage status: {status_chroma}")
+
+    if (
+        status_queries == Status.SUCCESS
+        and status_fetch == Status.SUCCESS
+        and status_postgres == Status.SUCCESS
+        and status_chroma == Status.SUCCESS
+    ):
+        logger.info("Updating paper database successfully.")
         return (
-            "Paper database has been updated with the latest papers & embeddings. There were some errors. "
-            "Ignore the errors and proceed with ranking the papers."
+            "Paper database has been updated with the latest papers & embeddings. There were no errors. "
+            "Now you can rank the papers."
         )
 
+    logger.error("Updating paper database failed.")
+    return (
+        "Paper database has been updated with the latest papers & embeddings. There were some errors. "
+        "Ignore the errors and proceed with ranking the papers."
+    )
+
 
 @tool
 def retry_broaden(keywords: list[str], query_description: str = "") -> str:
@@ -225,31 +317,9 @@ def retry_broaden(keywords: list[str], query_description: str = "") -> str:
             {"status": "error", "message": "No keywords provided. Cannot broaden."}
         )
 
-    prompt = f"""
-    You are an academic research assistant helping users improve their scientific paper search using the OpenAlex API.
-
-    The user has provided:
-    - A natural language description of their research goal
-    - A small list of initial keywords they used to search for papers
-
-    Your task is to intelligently **broaden and optimize** the keyword list. Follow these rules:
-
-    1. Only suggest **2 to 4** high-quality keywords.
-    2. Prioritize **concepts or terms that would likely exist in academic knowledge graphs** (like OpenAlex).
-    3. Avoid exact duplicates or overly generic terms (e.g. "research", "science").
-    4. Prefer well-known **scientific disciplines**, **methods**, or **subfields** related to the original topic.
-    5. Assume the keywords will be used in a query like:
-    `filter=keywords.id:keyword1|keyword2|...` which uses AND matching — so do **not** add too many.
-
-    Respond only with a JSON list of new keywords (do not include the original ones), e.g.:
-    ["metabolomics", "cellular respiration", "photoperiodism"]
-
-    User research description: "{query_description}"
-
-    Original keywords: {json.dumps(keywords)}
-
-    Broadened keyword list (JSON format only):
-    """
+    prompt = _BROADEN_PROMPT.format(
+        query_description=query_description, keywords_json=json.dumps(keywords)
+    )
 
     response = LLM.invoke(prompt)
 
@@ -287,35 +357,9 @@ def reformulate_query(keywords: list[str], query_description: str = "") -> str:
         logger.error("Query description was missing")
         return json.dumps({"status": "error", "message": "Missing query description."})
 
-    prompt = f"""
-    You are an AI-powered academic assistant helping researchers refine their literature search strategy using OpenAlex.
-
-    The user has submitted:
-    - A vague or imprecise research topic
-    - A list of keywords they initially used in the search
-
-    Your task is to **clarify the research intent** and **optimize the keyword list** so that:
-    1. The topic becomes academically precise and focused
-    2. The keywords are suitable for high-quality retrieval in OpenAlex
-
-    🔎 Guidelines for Keyword Optimization:
-    - Suggest only **2 to 4** highly relevant keywords
-    - Prefer keywords that match academic fields, subdisciplines, or research methods
-    - Avoid filler words, overly generic terms, or keyword duplication
-    - Assume the keywords will be used in a strict **AND** filter (i.e. all must be present), so select carefully to **maximize relevance while maintaining sufficient recall**
-
-    💡 Your goal is **focus**, not breadth. Do not add unrelated or tangential concepts.
-
-    Input:
-    - User query description: "{query_description}"
-    - Original keywords: {json.dumps(keywords)}
-
-    Respond with a JSON object of the form:
-    {{
-    "reformulated_description": "More focused and academically clear version of the user's research goal",
-    "refined_keywords": ["...", "...", "..."]
-    }}
-    """
+    prompt = _REFORMULATE_PROMPT.format(
+        query_description=query_description, keywords_json=json.dumps(keywords)
+    )
 
     response = LLM.invoke(prompt)
 
@@ -356,76 +400,90 @@ def detect_out_of_scope_query(query_description: str) -> str:
             }
         )
 
-    prompt = f"""
-    You are a research paper search assistant.
-
-    Analyze the following user query and determine if it is a valid academic topic
-    for a scientific literature search or if it is out-of-scope (e.g., a greeting,
-    joke, personal opinion, or unrelated to science).
-
-    If the query contains an appended paper, extract keywords also based on the paper.
-
-    If the query is valid, extract a list of 2-5 concise, domain-relevant keyword phrases (each 2-4 words) that best capture the research intent.
-
-    Guidelines for keyword extraction:
-    - Prefer multi-word, context-rich phrases over single words, but keep each phrase concise (2-4 words).
-    - Avoid full sentences or overly detailed descriptions.
-    - Do NOT repeat the same context in every keyword (e.g., don't add "in digital health" to every phrase).
-    - Avoid generic or overly broad terms (e.g., "deep learning", "artificial intelligence", "healthcare").
-    - Do NOT simply list synonyms or related fields.
-    - Each keyword should be a phrase that could be used as a precise search query for this specific research interest.
-    - Focus on specificity and informativeness, not quantity.
-
-    Given the following research query, extract 2-5 highly relevant, expressive academic keyword phrases (each 2-4 words) that would maximize the quality of a literature search. Avoid generic terms, full sentences, and focus on specificity.
-
-    Query: "{query_description}"
-
-    Respond with a JSON object like:
-    {{
-        "status": "valid" | "out_of_scope",
-        "reason": "...",  // explanation for decision
-        "keywords": [ ... ] // list of keyword phrases (empty if out_of_scope)
-    }}
-    """
-
-    response = LLM.invoke(prompt)
-
+    # Only an unparseable reply becomes an error reply; LLM/API errors propagate.
     try:
         logger.info("Checking if query is out of scope and extracting keywords.")
-        content = response.content
-        if isinstance(content, str):
-            try:
-                return json.dumps(json.loads(content))
-            except Exception:
-                return json.dumps(
-                    {
-                        "status": "error",
-                        "reason": "Failed to parse response. Raw content: " + content,
-                        "keywords": [],
-                    }
-                )
-        elif isinstance(content, (dict, list)):
-            return json.dumps(content)
-        else:
-            return json.dumps(
-                {
-                    "status": "error",
-                    "reason": "Unexpected response type.",
-                    "keywords": [],
-                }
-            )
-    except Exception as e:
+        return _classify_query_scope(query_description.strip())
+    except json.JSONDecodeError as e:
         logger.error(f"Failed to parse response: {e}")
         return json.dumps(
             {
                 "status": "error",
-                "reason": "Failed to parse response. Raw content: "
-                + str(response.content),
+                "reason": "Failed to parse response. Raw content: " + e.doc,
                 "keywords": [],
             }
         )
 
 
+@lru_cache(maxsize=256)
+def _classify_query_scope(query_description: str) -> str:
+    """
+    Ask the LLM whether a query is in scope and which keywords it yields.
+    Repeated runs for the same project description reuse the cached answer;
+    failures raise and are therefore never cached.
+    Args:
+        query_description (str): The stripped user query.
+    Returns:
+        str: The model's JSON object, re-serialised.
+    Raises:
+        json.JSONDecodeError: If the model's reply is not valid JSON.
+    """
+    prompt = _OUT_OF_SCOPE_PROMPT.format(query_description=query_description)
+
+    # Stream the response and stop as soon as the JSON object is complete, so any
+    # trailing commentary from the model is neither waited for nor parsed.
+    content = _read_json_object_from_stream(LLM.stream(prompt))
+    return json.dumps(json.loads(content))
+
+
+def _read_json_object_from_stream(chunks) -> str:
+    """
+    Consume streamed LLM chunks until the first top-level JSON object is complete.
+    Args:
+        chunks: Iterator of message chunks (objects with a ``content`` attribute) or strings.
+    Returns:
+        str: The text of the first balanced ``{...}`` object, or everything received
+        if the stream ended before an object was closed.
+    Side effects:
+        Closes the underlying stream once the object is complete.
+    """
+    received = []
+    offset = 0
+    start = None
+    depth = 0
+    in_string = False
+    escaped = False
+    try:
+        for chunk in chunks:
+            text = getattr(chunk, "content", chunk)
+            text = text if isinstance(text, str) else str(text)
+            received.append(text)
+            for i, char in enumerate(text):
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif char == "\\":
+                        escaped = True
+                    elif char == '"':
+                        in_string = False
+                elif char == '"' and depth:
+                    in_string = True
+                elif char == "{":
+                    if start is None:
+                        start = offset + i
+                    depth += 1
+                elif char == "}" and depth:
+                    depth -= 1
+                    if depth == 0:
+                        return "".join(received)[start : offset + i + 1]
+            offset += len(text)
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+    return "".join(received)
+
+
 @tool
 def narrow_query(query_description: str, keywords: list[str]) -> str:
     """
@@ -659,6 +717,13 @@ def apply_filter_spec_to_papers(
                 "status": "error",
                 "message": f"Unsupported operator '{rule['op']}'",
             }
+        if "value" not in rule:
+            return {
+                "status": "error",
+                "message": f"Missing value for '{filter_field}' in filter_spec",
+            }
+
+    rules = _compile_filter(filter_spec)
 
     # Normalize similarity scores before filtering
     normalized_papers = normalize_similarity_scores(papers)
@@ -667,8 +732,8 @@ def apply_filter_spec_to_papers(
     for paper in normalized_papers:
         try:
             if all(
-                _matches(paper.get(metric), rule["op"], rule["value"])
-                for metric, rule in filter_spec.items()
+                compare(_coerce(paper.get(metric)), target)
+                for metric, compare, target in rules
             ):
                 kept_papers.append(paper)
         except Exception as exc:
@@ -1070,18 +1135,18 @@ def main():
         ],
     }
 
+    dispatch = {
+        "retry_broaden": retry_broaden.invoke,
+        "reformulate_query": reformulate_query.invoke,
+        "detect_out_of_scope_query": detect_out_of_scope_query.invoke,
+    }
+
     for tool_name, input_list in tool_inputs.items():
         print(f"\n🛠️ Tool: {tool_name.upper()}")
+        invoke = dispatch.get(tool_name, lambda _: "❌ Unknown tool")
         for inputs in input_list:
             print(f"Input: {inputs}")
-            if tool_name == "retry_broaden":
-                output = retry_broaden.invoke(inputs)
-            elif tool_name == "reformulate_query":
-                output = reformulate_query.invoke(inputs)
-            elif tool_name == "detect_out_of_scope_query":
-                output = detect_out_of_scope_query.invoke(inputs)
-            else:
-                output = "❌ Unknown tool"
+            output = invoke(inputs)
             print("Output:", output)
             print("-" * 60)
 
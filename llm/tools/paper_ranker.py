@@ -13,7 +13,7 @@ import logging
 from llm.Embeddings import embed_user_profile
 from langchain_core.tools import tool
 from chroma_db.chroma_vector_db import chroma_db
-from database.papers_database_handler import get_papers_by_hash, get_all_papers
+from database.papers_database_handler import get_papers_by_hash, get_papers_count
 from database.projects_database_handler import (
     get_user_profile_embedding,
     add_user_profile_embedding,
@@ -38,31 +38,39 @@ def get_best_papers(project_id: str, num_candidates: int = 10) -> list[dict]:
     Side effects:
         May create and store a new user profile embedding if not present.
     """
+    if not project_id or not project_id.strip():
+        logger.warning("Empty project_id, skipping paper ranking.")
+        return []
+
     try:
         embedded_profile = get_user_profile_embedding(project_id)
 
         if embedded_profile:
-            logger.info(f"Using stored embedding for project {project_id}")
+            logger.info("Using stored embedding for project %s", project_id)
         else:
-            logger.info(f"No embedding found for project {project_id}, creating one...")
+            logger.info(
+                "No embedding found for project %s, creating one...", project_id
+            )
             project_data = get_project_data(project_id)
             description = project_data.get("description") if project_data else None
 
-            if not description:
-                logger.error(f"No project description found for project {project_id}")
+            if not description or not description.strip():
+                logger.error("No project description found for project %s", project_id)
                 return []
 
             embedded_profile = embed_user_profile(description)
             if not embedded_profile:
-                logger.error(f"Failed to create embedding for project {project_id}")
+                logger.error("Failed to create embedding for project %s", project_id)
                 return []
 
             add_user_profile_embedding(project_id, embedded_profile)
-            logger.info(f"Created and saved embedding for project {project_id}")
+            logger.info("Created and saved embedding for project %s", project_id)
 
     except Exception as e:
         logger.error(
-            f"Error getting or creating user profile embedding for project {project_id}: {e}"
+            "Error getting or creating user profile embedding for project %s: %s",
+            project_id,
+            e,
         )
         return []
 
@@ -73,18 +81,21 @@ def get_best_papers(project_id: str, num_candidates: int = 10) -> list[dict]:
     try:
         if num_candidates != 10:
             logger.info(
-                f"Agent requested {num_candidates} candidates, which is different than the default of 10. This will allow for more filtering."
+                "Agent requested %s candidates, which is different than the default of 10. This will allow for more filtering.",
+                num_candidates,
             )
 
         paper_hashes = chroma_db.perform_similarity_search(
             num_candidates, embedded_profile
         )
         logger.info(
-            f"Similarity search returned {len(paper_hashes) if paper_hashes else 0} hashes (requested: {num_candidates})"
+            "Similarity search returned %d hashes (requested: %d)",
+            len(paper_hashes) if paper_hashes else 0,
+            num_candidates,
         )
 
     except Exception as e:
-        logger.error(f"Error performing similarity search: {e}")
+        logger.error("Error performing similarity search: %s", e)
         return []
 
     if not paper_hashes:
@@ -93,36 +104,25 @@ def get_best_papers(project_id: str, num_candidates: int = 10) -> list[dict]:
 
     try:
         # Debug: Check what hashes we're looking for
-        logger.info(f"Looking for hashes: {paper_hashes[:3]}...")  # Show first 3
+        logger.debug("Looking for hashes: %s...", paper_hashes[:3])  # Show first 3
 
         paper_metadata = get_papers_by_hash(paper_hashes)
-        logger.info(f"Paper metadata: {paper_metadata}")
         logger.info(
-            f"Number of papers found: {len(paper_metadata) if paper_metadata else 0}"
+            "Number of papers found: %d", len(paper_metadata) if paper_metadata else 0
         )
 
-        # Debug: Check if any of the hashes exist in the database
-        if not paper_metadata and paper_hashes:
-            all_papers = get_all_papers()
-            all_hashes = [
-                p.get("paper_hash") for p in all_papers if p.get("paper_hash")
-            ]
-            logger.info(f"Sample hashes in database: {all_hashes[:3]}")
-            logger.info(
-                f"Any matching hashes: {any(h in all_hashes for h in paper_hashes[:3])}"
+        if not paper_metadata:
+            logger.warning(
+                "None of the %d hashes from ChromaDB exist in papers_table",
+                len(paper_hashes),
             )
 
     except Exception as e:
-        logger.error(f"Error linking hashes to metadata: {e}")
+        logger.error("Error linking hashes to metadata: %s", e)
         return []
 
-    # Debug: Check if there are any papers in the database
-    try:
-        all_papers = get_all_papers()
-        logger.info(f"Total papers in database: {len(all_papers)}")
-        if all_papers:
-            logger.info(f"Sample paper hash: {all_papers[0].get('paper_hash', 'N/A')}")
-    except Exception as e:
-        logger.error(f"Error checking database state: {e}")
+    # Debug: Check how many papers are in the database
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Total papers in database: %d", get_papers_count())
 
     return paper_metadata if paper_metadata else []
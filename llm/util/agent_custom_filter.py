@@ -7,10 +7,9 @@ Responsibilities:
 - Used by the agent and filtering tools to apply user-defined criteria
 """
 
-from typing import Any
+from typing import Any, Callable
 import logging
 import operator
-import re
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +25,6 @@ _OPERATORS = {
     "not in": lambda x, vals: x not in vals,
 }
 
-DATE_RE = re.compile(r"^\d{4}(-\d{2}-\d{2})?$")
-
 
 def _coerce(val: Any):
     """
@@ -37,24 +34,39 @@ def _coerce(val: Any):
     Returns:
         Any: The coerced value (int for dates, original otherwise).
     """
-    if isinstance(val, str) and DATE_RE.match(val):
-        # year or full date → int(year)
-        return int(val[:4])
+    if isinstance(val, str):
+        # year ("YYYY") or full date ("YYYY-MM-DD") → int(year)
+        n = len(val)
+        if n == 4 and val.isdecimal():
+            return int(val)
+        if (
+            n == 10
+            and val[4] == "-"
+            and val[7] == "-"
+            and val[:4].isdecimal()
+            and val[5:7].isdecimal()
+            and val[8:].isdecimal()
+        ):
+            return int(val[:4])
     return val
 
 
-def _matches(field_val, op: str, target):
+def _compile_filter(
+    filter_spec: dict,
+) -> list[tuple[str, Callable[[Any, Any], bool], Any]]:
     """
-    Compare a field value to a target using the specified operator.
+    Resolve each rule's operator and coerce its target once, ahead of the per-paper loop.
     Args:
-        field_val: The value from the paper metadata.
-        op (str): The operator as a string (e.g., '>', 'in').
-        target: The target value to compare against.
+        filter_spec (dict): Mapping of field name to {"op": str, "value": Any}.
     Returns:
-        bool: True if the comparison matches, False otherwise.
+        list[tuple[str, Callable, Any]]: (field, comparison function, coerced target) per rule.
     Raises:
-        ValueError: If the operator is not supported.
+        ValueError: If an operator is not supported.
     """
-    if op not in _OPERATORS:
-        raise ValueError(f"Unsupported op '{op}'")
-    return _OPERATORS[op](_coerce(field_val), _coerce(target))
+    compiled = []
+    for field, rule in filter_spec.items():
+        op = rule["op"]
+        if op not in _OPERATORS:
+            raise ValueError(f"Unsupported op '{op}'")
+        compiled.append((field, _OPERATORS[op], _coerce(rule["value"])))
+    return compiled
@@ -8,7 +8,34 @@ Responsibilities:
 - Used by agent streaming and debugging flows
 """
 
-import re
+
+def _grab_word_after(message, markers):
+    """
+    Find the first word that follows any of the given markers.
+    Args:
+        message (str): The log message.
+        markers (tuple[str, ...]): Literal markers such as "Name:".
+    Returns:
+        tuple[str, int] or None: The word and the index just past it, or None if not found.
+    """
+    best = None
+    for marker in markers:
+        start = message.find(marker)
+        while start != -1:
+            pos = start + len(marker)
+            while pos < len(message) and message[pos].isspace():
+                pos += 1
+            end = pos
+            while end < len(message) and (
+                message[end].isalnum() or message[end] == "_"
+            ):
+                end += 1
+            if end > pos:
+                if best is None or start < best[0]:
+                    best = (start, message[pos:end], end)
+                break
+            start = message.find(marker, start + 1)
+    return (best[1], best[2]) if best else None
 
 
 def format_log_message(message):
@@ -46,11 +73,11 @@ def extract_tool_name(message):
         str: The extracted tool name, or 'Unknown Tool' if not found.
     """
     # Look for patterns like "Tool Call: tool_name"
-    match = re.search(r"Tool Calls?:\s*(\w+)", message)
-    if match:
-        return match.group(1)
-    else:
-        match = re.search(r"Name:\s*(\w+)", message)
+    found = _grab_word_after(
+        message, ("Tool Call:", "Tool Calls:")
+    ) or _grab_word_after(message, ("Name:",))
+    if found:
+        return found[0]
     return "Unknown Tool"
 
 
@@ -63,9 +90,9 @@ def extract_args(message):
         str: Truncated arguments string, or a default message if not found.
     """
     # Search for the "Args" part of the log message
-    match = re.search(r"Args:\s*(.*)", message)
-    if match:
-        args = match.group(1)
+    idx = message.find("Args:")
+    if idx != -1:
+        args = message[idx + len("Args:") :].lstrip().split("\n", 1)[0]
         # Truncate the arguments if necessary (e.g., limit to first 5 items)
         truncated_args = truncate_args(args)
         return truncated_args
@@ -81,14 +108,10 @@ def truncate_args(args_str, limit=200):
     Returns:
         str: Truncated arguments string.
     """
-    # Truncate arguments list to the first 'limit' items
-    try:
-        # Parse the string into a list
-        truncated = args_str[:limit]
-        # Return the truncated list as a string representation
-        return str(truncated) + ("..." if len(args_str) > limit else "")
-    except Exception:
+    # Short arguments are returned as-is without copying
+    if len(args_str) <= limit:
         return args_str
+    return args_str[:limit] + "..."
 
 
 def extract_tool_response(message):
@@ -100,10 +123,10 @@ def extract_tool_response(message):
         str: Formatted tool response string, or a default message if not found.
     """
     # Search for the "Tool Message" section in the log message
-    match = re.search(r"Name:\s*(\w+)\s*(.*)", message, re.DOTALL)
-    if match:
-        tool_name = match.group(1)
-        response = match.group(2).strip()
+    found = _grab_word_after(message, ("Name:",))
+    if found:
+        tool_name, end = found
+        response = message[end:].strip()
         # Truncate the response if necessary
         truncated_response = truncate_tool_response(response)
         return f"Tool: {tool_name}, Response: {truncated_response}"
@@ -119,7 +142,7 @@ def truncate_tool_response(response_str, limit=100):
     Returns:
         str: Truncated response string.
     """
-    # Truncate the response if it's too long
-    if len(response_str) > limit:
-        return response_str[:limit] + "..."
-    return response_str
+    # Short responses are returned as-is without copying
+    if len(response_str) <= limit:
+        return response_str
+    return response_str[:limit] + "..."
@@ -9,6 +9,8 @@ Responsibilities:
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 from pyalex import Works
 
@@ -20,6 +22,33 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only stand-in for missing nested OpenAlex objects.
+_EMPTY = MappingProxyType({})
+
+# Concurrent OpenAlex searches per fetch_works_multiple_queries call.
+_MAX_OPENALEX_WORKERS = 8
+
+# Markers of scraped page chrome rather than an abstract, matched in one pass.
+_SPAM_INDICATORS_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            (
+                "previous article",
+                "next article",
+                "google scholar",
+                "crossref",
+                "bibtex",
+                "https://doi.org",
+                "add to favorites",
+                "export citation",
+            ),
+        )
+    )
+)
+_CITATION_REF_RE = re.compile(r"\[\d+\]")
+_SENTENCE_END_RE = re.compile(r"[.!?]")
+
 
 def _fetch_works_single_query(query, from_publication_date=None, per_page=10):
     """
@@ -70,23 +99,23 @@ def _fetch_works_single_query(query, from_publication_date=None, per_page=10):
             authorships = work.get("authorships", [])
             authors = ", ".join([a["author"]["display_name"] for a in authorships])
 
-            # Extract URLs
-            primary_location = work.get("primary_location", {})
+            # Extract URLs (OpenAlex sends null for missing nested objects)
+            primary_location = work.get("primary_location") or _EMPTY
             landing_page_url = primary_location.get("landing_page_url")
             pdf_url = primary_location.get("pdf_url")
 
             # Extract venue information from primary_location source
-            source = primary_location.get("source", {}) if primary_location else {}
-            venue_name = source.get("display_name") if source else None
-            venue_type = source.get("type") if source else None
+            source = primary_location.get("source") or _EMPTY
+            venue_name = source.get("display_name")
+            venue_type = source.get("type")
 
             publication_date = work.get("publication_date")
 
             # Extract open access information
-            open_access = work.get("open_access", {})
-            is_oa = open_access.get("is_oa", False) if open_access else False
-            oa_status = open_access.get("oa_status") if open_access else None
-            oa_url = open_access.get("oa_url") if open_access else None
+            open_access = work.get("open_access") or _EMPTY
+            is_oa = open_access.get("is_oa", False)
+            oa_status = open_access.get("oa_status")
+            oa_url = open_access.get("oa_url")
 
             relevance = work.get("relevance_score")
             citation_normalized_percentile = work.get("citation_normalized_percentile")
@@ -137,17 +166,24 @@ def fetch_works_multiple_queries(queries, from_publication_date=None, per_page=1
     """
     all_works = []
     any_failure = False
-    for query in queries:
+    if not queries:
+        return all_works, Status.SUCCESS
+
+    def fetch(query):
         try:
-            works, status = _fetch_works_single_query(
-                query, from_publication_date, per_page
-            )
+            return _fetch_works_single_query(query, from_publication_date, per_page)
+        except Exception as e:
+            print(f"Error fetching works for query '{query}': {e}")
+            return [], Status.FAILURE
+
+    # Each query is an independent OpenAlex round-trip; map() keeps query order.
+    with ThreadPoolExecutor(
+        max_workers=min(_MAX_OPENALEX_WORKERS, len(queries))
+    ) as executor:
+        for works, status in executor.map(fetch, queries):
             all_works.extend(works)
             if status == Status.FAILURE:
                 any_failure = True
-        except Exception as e:
-            print(f"Error fetching works for query '{query}': {e}")
-            any_failure = True
     logger.info(f"Fetched {len(all_works)} papers")
     return all_works, Status.FAILURE if any_failure else Status.SUCCESS
 
@@ -192,7 +228,6 @@ def is_valid_abstract(text, min_words=50, max_words=500):
     Returns:
         bool: True if valid, False otherwise.
     """
-    lower_text = text.lower()
     word_count = len(text.split())
 
     # Reject if too short or too long
@@ -200,25 +235,15 @@ def is_valid_abstract(text, min_words=50, max_words=500):
         return False
 
     # Reject if it contains obvious non-abstract elements
-    spam_indicators = [
-        "previous article",
-        "next article",
-        "google scholar",
-        "crossref",
-        "bibtex",
-        "https://doi.org",
-        "add to favorites",
-        "export citation",
-    ]
-    if any(indicator in lower_text for indicator in spam_indicators):
+    if _SPAM_INDICATORS_RE.search(text.lower()):
         return False
 
     # Reject if it contains many citation-style references like "[1]" or "[2]"
-    if len(re.findall(r"\[\d+\]", text)) > 5:
+    if len(_CITATION_REF_RE.findall(text)) > 5:
         return False
 
     # Reject if there are too few sentence-ending punctuations
-    sentence_endings = len(re.findall(r"[.!?]", text))
+    sentence_endings = len(_SENTENCE_END_RE.findall(text))
     if sentence_endings < 3:
         return False
 
@@ -70,11 +70,16 @@ def enable_test_mode():
 
     # Mock the OpenAI client for embeddings
     mock_client = MagicMock()
-    mock_embedding_response = MagicMock()
-    mock_embedding_response.data = [
-        MagicMock(embedding=[0.1] * 1536)
-    ]  # Standard embedding size
-    mock_client.embeddings.create.return_value = mock_embedding_response
+
+    def mock_embeddings_create(input, **kwargs):
+        # One standard-size embedding per input text, as the real API returns
+        mock_embedding_response = MagicMock()
+        mock_embedding_response.data = [
+            MagicMock(embedding=[0.1] * 1536) for _ in input
+        ]
+        return mock_embedding_response
+
+    mock_client.embeddings.create.side_effect = mock_embeddings_create
 
     original_client = embeddings_module.client
     embeddings_module.client = mock_client
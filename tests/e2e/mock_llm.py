@@ -94,6 +94,18 @@ class MockLLM:
         else:
             return MockLLMResponse(self.responses["default"])
 
+    def stream(self, prompt: str):
+        """
+        Mock stream method that yields the invoke() response as a single chunk.
+
+        Args:
+            prompt: The input prompt (string or list of messages)
+
+        Yields:
+            MockLLMResponse with appropriate content
+        """
+        yield self.invoke(prompt)
+
     def __call__(self, *args, **kwargs):
         """Allow calling the mock like a function."""
         if args: